@@ -1,7 +1,17 @@
 from django.contrib.auth import get_user_model
 from rest_framework import status
+from rest_framework.authtoken.models import Token
 from rest_framework.test import APITestCase
 
+from common.authentication import ProfileTokenAuthentication
+from profiles.models import Profile
+
+
+User = get_user_model()
+
+
+AUTH_PAYLOAD_KEYS = frozenset({"token", "username", "email", "user_id"})
+
 
 class RegistrationApiTests(APITestCase):
     def setUp(self):
@@ -36,9 +46,11 @@ class RegistrationApiTests(APITestCase):
 
 
 class LoginApiTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = _create_user("exampleUsername", "example@mail.de", "examplePassword")
+
     def setUp(self):
-        self.user_model = get_user_model()
-        self.user = _create_user(self.user_model, "exampleUsername", "example@mail.de", "examplePassword")
         self.url = "/api/login/"
         self.payload = {
             "username": "exampleUsername",
@@ -54,16 +66,40 @@ class LoginApiTests(APITestCase):
         self.assertEqual(data["username"], self.payload["username"])
         self.assertEqual(data["email"], self.user.email)
 
+    def test_login_returns_new_token_after_token_deleted(self):
+        first = self.client.post(self.url, self.payload, format="json").json()
+        Token.objects.filter(user=self.user).delete()
+
+        second = self.client.post(self.url, self.payload, format="json").json()
+
+        self.assertNotEqual(second["token"], first["token"])
+        self.assertTrue(Token.objects.filter(key=second["token"]).exists())
+
     def test_login_invalid_credentials_returns_400(self):
         response = self.client.post(self.url, {"username": "exampleUsername", "password": "wrong"}, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
 
+class ProfileTokenAuthenticationTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = _create_user("token_user", "token_user@example.com", "examplePassword")
+        Profile.objects.create(user=cls.user, type=Profile.TYPE_BUSINESS)
+        cls.token = Token.objects.create(user=cls.user)
+
+    def test_authenticate_credentials_loads_profile(self):
+        with self.assertNumQueries(1):
+            user, token = ProfileTokenAuthentication().authenticate_credentials(self.token.key)
+
+        with self.assertNumQueries(0):
+            self.assertEqual(user.profile.type, Profile.TYPE_BUSINESS)
+        self.assertEqual(token, self.token)
+
+
 def _assert_auth_payload(testcase, data):
-    for key in ["token", "username", "email", "user_id"]:
-        testcase.assertIn(key, data)
+    testcase.assertFalse(AUTH_PAYLOAD_KEYS - data.keys(), "missing keys")
 
 
-def _create_user(user_model, username, email, password, **kwargs):
-    return user_model.objects.create_user(username=username, email=email, password=password, **kwargs)
+def _create_user(username, email, password, **kwargs):
+    return User.objects.create_user(username=username, email=email, password=password, **kwargs)
@@ -1,27 +1,82 @@
 """Base info view."""
 
-from django.db.models import Avg
+from django.core.cache import cache
+from django.db import DatabaseError, connection
+from django.http import HttpResponse
+from django.utils.cache import patch_cache_control
 from rest_framework import permissions
-from rest_framework.response import Response
+from rest_framework.renderers import JSONRenderer
 from rest_framework.views import APIView
 
 from offers.models import Offer
 from profiles.models import Profile
 from reviews.models import Review
 
+BASE_INFO_CACHE_KEY = "base_info"
+BASE_INFO_CACHE_TIMEOUT = 60
+BASE_INFO_STALE_CACHE_KEY = "base_info:stale"
+BASE_INFO_STALE_CACHE_TIMEOUT = 60 * 60 * 24
+
+
+def _base_info_sql():
+    """Return one statement selecting every statistic as a scalar subquery."""
+    quote = connection.ops.quote_name
+    reviews = quote(Review._meta.db_table)
+    profiles = quote(Profile._meta.db_table)
+    offers = quote(Offer._meta.db_table)
+    rating = quote(Review._meta.get_field("rating").column)
+    profile_type = quote(Profile._meta.get_field("type").column)
+    return (
+        f"SELECT (SELECT COUNT(*) FROM {reviews}), "
+        f"(SELECT AVG({rating}) FROM {reviews}), "
+        f"(SELECT COUNT(*) FROM {profiles} WHERE {profile_type} = %s), "
+        f"(SELECT COUNT(*) FROM {offers})"
+    )
+
+
+def _compute_base_info():
+    """Collect the platform statistics in a single database round trip."""
+    with connection.cursor() as cursor:
+        cursor.execute(_base_info_sql(), [Profile.TYPE_BUSINESS])
+        review_count, avg, business_count, offer_count = cursor.fetchone()
+    return {
+        "review_count": review_count,
+        "average_rating": round(float(avg or 0), 1),
+        "business_profile_count": business_count,
+        "offer_count": offer_count,
+    }
+
+
+def _render_base_info():
+    """Return the platform statistics as encoded JSON."""
+    return JSONRenderer().render(_compute_base_info())
+
+
+def _get_base_info_content():
+    """Return cached base info, falling back to the last good copy on DB errors."""
+    content = cache.get(BASE_INFO_CACHE_KEY)
+    if content is not None:
+        return content
+    try:
+        content = _render_base_info()
+    except DatabaseError:
+        content = cache.get(BASE_INFO_STALE_CACHE_KEY)
+        if content is None:
+            raise
+        return content
+    cache.set(BASE_INFO_CACHE_KEY, content, BASE_INFO_CACHE_TIMEOUT)
+    cache.set(BASE_INFO_STALE_CACHE_KEY, content, BASE_INFO_STALE_CACHE_TIMEOUT)
+    return content
+
 
 class BaseInfoView(APIView):
-    """Return base info statistics."""
+    """Return base info statistics as cached, pre-rendered JSON."""
     permission_classes = [permissions.AllowAny]
     authentication_classes = []
 
     def get(self, request):
-        review_stats = Review.objects.aggregate(avg=Avg("rating"))
-        avg = review_stats["avg"] or 0
-        data = {
-            "review_count": Review.objects.count(),
-            "average_rating": round(avg, 1),
-            "business_profile_count": Profile.objects.filter(type=Profile.TYPE_BUSINESS).count(),
-            "offer_count": Offer.objects.count(),
-        }
-        return Response(data)
+        content = _get_base_info_content()
+        response = HttpResponse(content, content_type="application/json")
+        patch_cache_control(
+            response, public=True, max_age=BASE_INFO_CACHE_TIMEOUT)
+        return response
@@ -4,3 +4,6 @@ from django.apps import AppConfig
 class BaseInfoConfig(AppConfig):
     default_auto_field = 'django.db.models.BigAutoField'
     name = 'base_info'
+
+    def ready(self):
+        from base_info import signals  # noqa: F401
@@ -0,0 +1,18 @@
+"""Signal handlers that keep the cached base info fresh."""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from base_info.api.views import BASE_INFO_CACHE_KEY
+from offers.models import Offer
+from profiles.models import Profile
+from reviews.models import Review
+
+
+@receiver([post_save, post_delete], sender=Review)
+@receiver([post_save, post_delete], sender=Profile)
+@receiver([post_save, post_delete], sender=Offer)
+def invalidate_base_info(sender, **kwargs):
+    """Drop cached base info when a counted model changes."""
+    cache.delete(BASE_INFO_CACHE_KEY)
@@ -1,15 +1,82 @@
+from unittest import mock
+
+from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import OperationalError
 from rest_framework import status
 from rest_framework.test import APITestCase
 
+from base_info.api.views import BASE_INFO_CACHE_KEY
+from offers.models import Offer
+from profiles.models import Profile
+from reviews.models import Review
+
+
+User = get_user_model()
+
+
+BASE_INFO_KEYS = frozenset(
+    {"review_count", "average_rating", "business_profile_count", "offer_count"})
+
 
 class BaseInfoApiTests(APITestCase):
     def setUp(self):
         self.url = "/api/base-info/"
+        cache.clear()
 
     def test_get_base_info_success(self):
         response = self.client.get(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         data = response.json()
-        for key in ["review_count", "average_rating", "business_profile_count", "offer_count"]:
-            self.assertIn(key, data)
+        self.assertFalse(BASE_INFO_KEYS - data.keys(), "missing keys")
+
+    def test_get_base_info_served_from_cache(self):
+        first = self.client.get(self.url)
+
+        with self.assertNumQueries(0):
+            second = self.client.get(self.url)
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.json(), first.json())
+
+    def test_get_base_info_computed_in_one_query(self):
+        business_user = User.objects.create_user(username="base_info_business")
+        reviewer = User.objects.create_user(username="base_info_reviewer")
+        Profile.objects.create(user=business_user, type=Profile.TYPE_BUSINESS)
+        Profile.objects.create(user=reviewer, type=Profile.TYPE_CUSTOMER)
+        Offer.objects.create(user=business_user, title="Counted offer")
+        Review.objects.create(business_user=business_user, reviewer=reviewer, rating=4)
+        Review.objects.create(business_user=reviewer, reviewer=business_user, rating=5)
+        cache.clear()
+
+        with self.assertNumQueries(1):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.json(), {
+            "review_count": 2,
+            "average_rating": 4.5,
+            "business_profile_count": 1,
+            "offer_count": 1,
+        })
+
+    def test_get_base_info_refreshed_after_offer_created(self):
+        self.client.get(self.url)
+        user = User.objects.create_user(username="base_info_owner")
+        Offer.objects.create(user=user, title="Fresh offer")
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.json()["offer_count"], 1)
+        self.assertIn("max-age=60", response["Cache-Control"])
+
+    def test_get_base_info_serves_stale_copy_when_database_fails(self):
+        first = self.client.get(self.url)
+        cache.delete(BASE_INFO_CACHE_KEY)
+
+        with mock.patch("base_info.api.views._compute_base_info",
+                        side_effect=OperationalError):
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), first.json())
@@ -1,7 +1,12 @@
 """Management command to seed demo data."""
 
+from itertools import cycle
+from types import MappingProxyType
+
 from django.contrib.auth import get_user_model
 from django.core.management.base import BaseCommand
+from django.db import transaction
+from django.db.models import Prefetch, prefetch_related_objects
 
 from offers.models import Offer, OfferDetail
 from orders.models import Order
@@ -9,80 +14,90 @@ from profiles.models import Profile
 from reviews.models import Review
 
 
-USERS_DATA = [
-    {
+USERS_DATA = (
+    MappingProxyType({
         "username": "andrey",
         "email": "andrey@example.com",
         "password": "asdasd",
         "first_name": "Andrey",
         "last_name": "Customer",
         "type": Profile.TYPE_CUSTOMER,
-    },
-    {
+    }),
+    MappingProxyType({
         "username": "customer_jane",
         "email": "customer_jane@example.com",
         "password": "asdasd",
         "first_name": "Jane",
         "last_name": "Doe",
         "type": Profile.TYPE_CUSTOMER,
-    },
-    {
+    }),
+    MappingProxyType({
         "username": "kevin",
         "email": "kevin@business.de",
         "password": "asdasd24",
         "first_name": "Kevin",
         "last_name": "Business",
         "type": Profile.TYPE_BUSINESS,
-    },
-    {
+    }),
+    MappingProxyType({
         "username": "biz_maria",
         "email": "maria@business.de",
         "password": "asdasd24",
         "first_name": "Maria",
         "last_name": "Business",
         "type": Profile.TYPE_BUSINESS,
-    },
-]
+    }),
+)
 
 
-OFFER_SPECS = [
-    {
+OFFER_SPECS = (
+    MappingProxyType({
         "title": "Website Design",
         "description": "Professionelles Website-Design.",
-    },
-    {
+    }),
+    MappingProxyType({
         "title": "Logo Design",
         "description": "Individuelle Logos für Unternehmen.",
-    },
-]
+    }),
+)
 
 
-OFFER_DETAILS = [
-    {
+OFFER_DETAILS = (
+    MappingProxyType({
         "offer_type": OfferDetail.OFFER_TYPE_BASIC,
         "title": "Basic Design",
         "revisions": 2,
         "delivery_time_in_days": 5,
         "price": 100,
-        "features": ["Logo Design", "Visitenkarte"],
-    },
-    {
+        "features": ("Logo Design", "Visitenkarte"),
+    }),
+    MappingProxyType({
         "offer_type": OfferDetail.OFFER_TYPE_STANDARD,
         "title": "Standard Design",
         "revisions": 5,
         "delivery_time_in_days": 7,
         "price": 200,
-        "features": ["Logo Design", "Visitenkarte", "Briefpapier"],
-    },
-    {
+        "features": ("Logo Design", "Visitenkarte", "Briefpapier"),
+    }),
+    MappingProxyType({
         "offer_type": OfferDetail.OFFER_TYPE_PREMIUM,
         "title": "Premium Design",
         "revisions": 10,
         "delivery_time_in_days": 10,
         "price": 500,
-        "features": ["Logo Design", "Visitenkarte", "Briefpapier", "Flyer"],
-    },
-]
+        "features": ("Logo Design", "Visitenkarte", "Briefpapier", "Flyer"),
+    }),
+)
+
+
+SEED_BATCH_SIZE = 500
+
+PROFILE_DEFAULTS = MappingProxyType({
+    "location": "Berlin",
+    "tel": "123456789",
+    "description": "Demo description",
+    "working_hours": "9-17",
+})
 
 
 def _order_defaults(detail):
@@ -101,108 +116,141 @@ class Command(BaseCommand):
     """Seed demo data for local development."""
     help = "Seed demo data for Coderr"
 
+    @transaction.atomic
     def handle(self, *args, **options):
         """Entry point for the management command."""
         user_model = get_user_model()
         users = self._create_users(user_model)
+        self._update_profiles(users)
         business_users, customer_users = self._split_users(users)
         offers = self._create_offers(business_users)
+        self._ensure_offer_details(offers)
         self._create_reviews(business_users, customer_users)
         self._create_orders(offers, customer_users)
-        self.stdout.write(self.style.SUCCESS("Demo data seeded."))
+        self.stdout.write(self.style.SUCCESS(
+            "Demo data seeded: "
+            f"{len(users)} users, {len(offers)} offers, "
+            f"{len(offers) * len(OFFER_DETAILS)} offer details, "
+            f"{len(business_users) * len(customer_users)} reviews, "
+            f"{len({offer.user_id for offer in offers})} orders."
+        ))
 
     def _create_users(self, user_model):
-        """Create users and profiles from seed data."""
-        users = []
-        for data in USERS_DATA:
-            user = self._get_or_create_user(user_model, data)
-            self._update_profile(user, data["type"])
-            users.append(user)
-        return users
-
-    def _get_or_create_user(self, user_model, data):
-        """Get or create a user from seed data."""
-        user, created = user_model.objects.get_or_create(
+        """Create missing users and return all seed users in USERS_DATA order."""
+        usernames = [data["username"] for data in USERS_DATA]
+        existing = user_model.objects.in_bulk(usernames, field_name="username")
+        new_users = [
+            self._build_user(user_model, data)
+            for data in USERS_DATA if data["username"] not in existing
+        ]
+        if new_users:
+            user_model.objects.bulk_create(
+                new_users, batch_size=SEED_BATCH_SIZE, ignore_conflicts=True)
+            existing = user_model.objects.in_bulk(
+                usernames, field_name="username")
+        return [existing[username] for username in usernames]
+
+    def _build_user(self, user_model, data):
+        """Build an unsaved user with a hashed password from seed data."""
+        user = user_model(
             username=data["username"],
-            defaults={
-                "email": data["email"], "first_name": data["first_name"], "last_name": data["last_name"]},
+            email=data["email"],
+            first_name=data["first_name"],
+            last_name=data["last_name"],
         )
-        if created:
-            user.set_password(data["password"])
-            user.save()
+        user.set_password(data["password"])
         return user
 
-    def _update_profile(self, user, profile_type):
-        """Create or update profile details for a user."""
-        Profile.objects.update_or_create(
-            user=user,
-            defaults={
-                "type": profile_type,
-                "location": "Berlin",
-                "tel": "123456789",
-                "description": "Demo description",
-                "working_hours": "9-17",
-            },
-        )
+    def _update_profiles(self, users):
+        """Create or update profile details for the seed users."""
+        existing = {p.user_id: p for p in Profile.objects.filter(user__in=users)}
+        new_profiles = []
+        for user, data in zip(users, USERS_DATA):
+            profile = existing.get(user.pk)
+            if profile is None:
+                new_profiles.append(Profile(
+                    user_id=user.pk, type=data["type"], **PROFILE_DEFAULTS))
+                continue
+            profile.type = data["type"]
+            for field, value in PROFILE_DEFAULTS.items():
+                setattr(profile, field, value)
+        if existing:
+            Profile.objects.bulk_update(
+                existing.values(), ["type", *PROFILE_DEFAULTS],
+                batch_size=SEED_BATCH_SIZE)
+        if new_profiles:
+            Profile.objects.bulk_create(
+                new_profiles, batch_size=SEED_BATCH_SIZE, ignore_conflicts=True)
 
     def _split_users(self, users):
-        """Split users into business and customer groups."""
-        business = [u for u in users if u.profile.type ==
-                    Profile.TYPE_BUSINESS]
-        customer = [u for u in users if u.profile.type ==
-                    Profile.TYPE_CUSTOMER]
+        """Split users into business and customer groups by their seed type."""
+        typed = list(zip(users, (data["type"] for data in USERS_DATA)))
+        business = [u for u, t in typed if t == Profile.TYPE_BUSINESS]
+        customer = [u for u, t in typed if t == Profile.TYPE_CUSTOMER]
         return business, customer
 
     def _create_offers(self, business_users):
-        """Create offers for business users."""
-        offers = []
-        for idx, spec in enumerate(OFFER_SPECS):
-            owner = business_users[idx % len(business_users)]
-            offer = self._get_or_create_offer(owner, spec)
-            offers.append(offer)
-            self._ensure_offer_details(offer)
-        return offers
-
-    def _get_or_create_offer(self, owner, spec):
-        """Get or create an offer for a business user."""
-        offer, _ = Offer.objects.get_or_create(
-            user=owner,
-            title=spec["title"],
-            defaults={"description": spec["description"], "image": None},
+        """Create missing offers for business users and return all seed offers."""
+        keys = [(owner.pk, spec["title"])
+                for owner, spec in zip(cycle(business_users), OFFER_SPECS)]
+        existing = self._existing_offers(business_users)
+        new_offers = [
+            Offer(user_id=key[0], title=spec["title"],
+                  description=spec["description"], image=None)
+            for key, spec in zip(keys, OFFER_SPECS) if key not in existing
+        ]
+        if new_offers:
+            Offer.objects.bulk_create(new_offers, batch_size=SEED_BATCH_SIZE)
+            existing = self._existing_offers(business_users)
+        return [existing[key] for key in keys]
+
+    def _existing_offers(self, business_users):
+        """Return seed offers keyed by owner id and title."""
+        titles = [spec["title"] for spec in OFFER_SPECS]
+        offers = Offer.objects.filter(
+            user__in=business_users, title__in=titles).order_by("id")
+        existing = {}
+        for offer in offers:
+            existing.setdefault((offer.user_id, offer.title), offer)
+        return existing
+
+    def _ensure_offer_details(self, offers):
+        """Ensure all offer detail records exist."""
+        OfferDetail.objects.bulk_create(
+            [OfferDetail(offer=offer, **detail)
+             for offer in offers for detail in OFFER_DETAILS],
+            batch_size=SEED_BATCH_SIZE,
+            ignore_conflicts=True,
         )
-        return offer
 
     def _create_reviews(self, business_users, customer_users):
         """Create reviews for each business and customer pair."""
-        for business in business_users:
-            for customer in customer_users:
-                Review.objects.get_or_create(
-                    business_user=business,
-                    reviewer=customer,
-                    defaults={"rating": 5, "description": "Top Qualität!"},
-                )
+        Review.objects.bulk_create(
+            [Review(business_user=business, reviewer=customer,
+                    rating=5, description="Top Qualität!")
+             for business in business_users for customer in customer_users],
+            batch_size=SEED_BATCH_SIZE,
+            ignore_conflicts=True,
+        )
 
     def _create_orders(self, offers, customer_users):
         """Create orders for the first customer user."""
         customer = customer_users[0]
-        for offer in offers:
-            detail = offer.details.first()
-            if detail:
-                self._get_or_create_order(customer, offer, detail)
-
-    def _get_or_create_order(self, customer, offer, detail):
-        """Get or create an order for a detail."""
-        Order.objects.get_or_create(
-            customer_user=customer,
-            business_user=offer.user,
-            defaults=_order_defaults(detail),
+        ordered = set(
+            Order.objects.filter(customer_user=customer)
+            .values_list("business_user_id", flat=True)
         )
-
-    def _ensure_offer_details(self, offer):
-        """Ensure all offer detail records exist."""
-        for detail in OFFER_DETAILS:
-            OfferDetail.objects.get_or_create(
-                offer=offer,
-                offer_type=detail["offer_type"],
-                defaults=detail,
-            )
+        prefetch_related_objects(
+            offers, Prefetch("details", queryset=OfferDetail.objects.order_by("id")))
+        new_orders = []
+        for offer in offers:
+            detail = next(iter(offer.details.all()), None)
+            if detail and offer.user_id not in ordered:
+                ordered.add(offer.user_id)
+                new_orders.append(Order(
+                    customer_user=customer,
+                    business_user_id=offer.user_id,
+                    **_order_defaults(detail),
+                ))
+        if new_orders:
+            Order.objects.bulk_create(new_orders, batch_size=SEED_BATCH_SIZE)
@@ -1,5 +1,8 @@
 """Reusable permission classes for Coderr API."""
 
+import re
+from functools import lru_cache
+
 from django.contrib.auth import get_user_model
 from rest_framework import permissions
 
@@ -7,16 +10,29 @@ from profiles.models import Profile
 
 User = get_user_model()
 
+_CUSTOMER_RE = re.compile("customer")
+_BUSINESS_RE = re.compile("business")
 
-def _infer_profile_type(user):
-    """Infer profile type from user identifiers."""
-    username = (user.username or "").lower()
-    email = (user.email or "").lower()
-    if "customer" in username or "customer" in email:
+
+@lru_cache(maxsize=4096)
+def _classify_identity(username, email):
+    """Classify lowercased username and email into a profile type or None."""
+    identity = f"{username}\0{email}"
+    if _CUSTOMER_RE.search(identity):
         return Profile.TYPE_CUSTOMER
-    if "business" in username or "business" in email or username.startswith("biz") or "biz" in username:
+    if _BUSINESS_RE.search(identity) or "biz" in username:
         return Profile.TYPE_BUSINESS
-    return Profile.TYPE_CUSTOMER
+    return None
+
+
+def _guess_profile_type(user):
+    """Infer profile type from user identity hints, or None without a hint."""
+    return _classify_identity((user.username or "").lower(), (user.email or "").lower())
+
+
+def _infer_profile_type(user):
+    """Infer profile type from user identifiers."""
+    return _guess_profile_type(user) or Profile.TYPE_CUSTOMER
 
 
 def _get_profile_type(user):
@@ -44,8 +60,10 @@ class IsCustomerUser(permissions.BasePermission):
 
 
 class IsOfferOwner(permissions.BasePermission):
-    """Allow access only for offer owners."""
+    """Allow reading offers, but changes only for offer owners."""
     def has_object_permission(self, request, view, obj):
+        if request.method in permissions.SAFE_METHODS:
+            return True
         return obj.user_id == request.user.id
 
 
@@ -1,13 +1,27 @@
 """Shared API helpers."""
 
+from functools import partial
+
+from django.conf import settings
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.core.paginator import Paginator
+from django.utils.functional import cached_property
 from rest_framework import pagination, status
 from rest_framework.response import Response
 
+from common.permissions import _guess_profile_type
 from profiles.models import Profile
 
 User = get_user_model()
 
+PAGINATION_COUNT_CACHE_TIMEOUT = 60
+
+PROCESS_LOCAL_CACHE_BACKENDS = frozenset({
+    "django.core.cache.backends.dummy.DummyCache",
+    "django.core.cache.backends.locmem.LocMemCache",
+})
+
 
 def _get_ordering_param(request, allowed):
     """Return ordering param and validity flag."""
@@ -18,20 +32,34 @@ def _get_ordering_param(request, allowed):
 
 
 def _apply_ordering(queryset, ordering):
-    """Apply ordering when provided."""
+    """Apply ordering when provided, with the primary key as tiebreaker.
+
+    The tiebreaker follows the direction of the ordering so that a
+    descending sort can be served by a backward scan of a (field, id) index.
+    """
     if ordering:
-        return queryset.order_by(ordering)
+        tiebreaker = "-pk" if ordering.startswith("-") else "pk"
+        return queryset.order_by(ordering, tiebreaker)
     return queryset
 
 
-def _paginated_response(request, queryset, serializer_cls):
-    """Return a paginated response for a queryset."""
-    paginator = StandardResultsSetPagination()
+def _optionally_paginated_response(request, queryset, serializer_cls):
+    """Return a paginated response if requested, else the full list."""
+    paginator = OptionalResultsSetPagination()
+    if not queryset.ordered:
+        queryset = queryset.order_by("pk")
     page = paginator.paginate_queryset(queryset, request)
-    serializer = serializer_cls(page, many=True, context={"request": request})
+    if page is None:
+        return Response(serializer_cls(queryset, many=True).data)
+    serializer = serializer_cls(page, many=True)
     return paginator.get_paginated_response(serializer.data)
 
 
+def _cache_is_shared():
+    """Return whether the default cache is shared by all worker processes."""
+    return settings.CACHES["default"]["BACKEND"] not in PROCESS_LOCAL_CACHE_BACKENDS
+
+
 def _get_authenticated_user(request):
     """Return authenticated user or None."""
     user = getattr(request, "user", None)
@@ -40,15 +68,9 @@ def _get_authenticated_user(request):
     return None
 
 
-def _guess_profile_type(user):
-    """Infer profile type from user identity hints."""
-    username = (user.username or "").lower()
-    email = (user.email or "").lower()
-    if "customer" in username or "customer" in email:
-        return Profile.TYPE_CUSTOMER
-    if "business" in username or "business" in email or username.startswith("biz") or "biz" in username:
-        return Profile.TYPE_BUSINESS
-    return None
+def _default_profile_type(user, default_type=None):
+    """Return the type a missing profile of this user would get."""
+    return _guess_profile_type(user) or default_type or Profile.TYPE_CUSTOMER
 
 
 def _get_or_create_profile(user, default_type=None):
@@ -56,9 +78,17 @@ def _get_or_create_profile(user, default_type=None):
     try:
         return user.profile
     except Profile.DoesNotExist:
-        inferred_type = _guess_profile_type(user)
-        profile_type = inferred_type or default_type or Profile.TYPE_CUSTOMER
-        return Profile.objects.create(user=user, type=profile_type)
+        profile, _ = Profile.objects.get_or_create(
+            user=user, defaults={"type": _default_profile_type(user, default_type)})
+        return profile
+
+
+def _get_profile_or_unsaved(user):
+    """Return existing profile or an unsaved default one, without writing."""
+    try:
+        return user.profile
+    except Profile.DoesNotExist:
+        return Profile(user=user, type=_default_profile_type(user))
 
 
 def _get_business_profile_or_response(user):
@@ -72,7 +102,55 @@ def _get_business_profile_or_response(user):
     return profile, None
 
 
+class CachedCountPaginator(Paginator):
+    """Paginator that keeps the total count under an explicitly invalidated key."""
+
+    def __init__(self, object_list, per_page, *, cache_key, refresh_count=False,
+                 **kwargs):
+        super().__init__(object_list, per_page, **kwargs)
+        self.cache_key = cache_key
+        self.refresh_count = refresh_count
+
+    @cached_property
+    def count(self):
+        if not self.refresh_count:
+            count = cache.get(self.cache_key)
+            if count is not None:
+                return count
+        count = super().count
+        cache.set(self.cache_key, count, PAGINATION_COUNT_CACHE_TIMEOUT)
+        return count
+
+
 class StandardResultsSetPagination(pagination.PageNumberPagination):
-    """Pagination settings for list endpoints."""
+    """Pagination settings for list endpoints.
+
+    Views may offer a ``get_count_cache_key`` returning a key for the total
+    count; the first page recounts, later pages reuse the cached total. The
+    reuse needs a shared cache, since invalidation only reaches the cache of
+    the worker handling the write.
+    """
     page_size = 6
     page_size_query_param = "page_size"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        get_key = getattr(view, "get_count_cache_key", None)
+        cache_key = get_key() if get_key and _cache_is_shared() else None
+        if cache_key is None:
+            self.django_paginator_class = Paginator
+        else:
+            first_page = request.query_params.get(self.page_query_param, "1") == "1"
+            self.django_paginator_class = partial(
+                CachedCountPaginator, cache_key=cache_key, refresh_count=first_page)
+        return super().paginate_queryset(queryset, request, view)
+
+
+class OptionalResultsSetPagination(StandardResultsSetPagination):
+    """Pagination that only applies when a page or page size is requested."""
+    max_page_size = 100
+
+    def get_page_size(self, request):
+        params = request.query_params
+        if self.page_query_param in params or self.page_size_query_param in params:
+            return super().get_page_size(request)
+        return None
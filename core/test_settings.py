@@ -0,0 +1,12 @@
+"""
+Django settings for running the core project's test suite.
+
+Use with ``manage.py test --settings=core.test_settings``.
+"""
+
+from core.settings import *  # noqa: F401,F403
+
+# The test suite creates many users; a fast hasher keeps that cheap.
+PASSWORD_HASHERS = [
+    'django.contrib.auth.hashers.MD5PasswordHasher',
+]
@@ -6,14 +6,27 @@ from django.contrib import admin
 from django.urls import include, path
 from drf_spectacular.views import SpectacularAPIView, SpectacularSwaggerView
 
+from auths.api.urls import urlpatterns as auths_urlpatterns
+from base_info.api.urls import urlpatterns as base_info_urlpatterns
+from offers.api.urls import urlpatterns as offers_urlpatterns
+from orders.api.urls import urlpatterns as orders_urlpatterns
+from profiles.api.urls import urlpatterns as profiles_urlpatterns
+from reviews.api.urls import urlpatterns as reviews_urlpatterns
+
+# One resolver for the whole API, so a request matches the api/ prefix
+# once instead of once per app.
+api_urlpatterns = [
+    *profiles_urlpatterns,
+    *offers_urlpatterns,
+    *orders_urlpatterns,
+    *reviews_urlpatterns,
+    *auths_urlpatterns,
+    *base_info_urlpatterns,
+]
+
 urlpatterns = [
     path('admin/', admin.site.urls),
-    path('api/', include('profiles.api.urls')),
-    path('api/', include('offers.api.urls')),
-    path('api/', include('orders.api.urls')),
-    path('api/', include('reviews.api.urls')),
-    path('api/', include('auths.api.urls')),
-    path('api/', include('base_info.api.urls')),
+    path('api/', include(api_urlpatterns)),
     path('api/schema/', SpectacularAPIView.as_view(), name='schema'),
     path('api/docs/', SpectacularSwaggerView.as_view(url_name='schema'),
          name='swagger-ui'),
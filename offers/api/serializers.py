@@ -1,24 +1,37 @@
 """Offer serializers."""
 
 from django.db import transaction
+from django.db.models import Min
 from rest_framework import serializers
 
 from offers.models import Offer, OfferDetail
 
+DETAIL_UPDATE_FIELDS = [
+    "title",
+    "revisions",
+    "delivery_time_in_days",
+    "price",
+    "features",
+]
 
-def _min_or_none(values):
-    """Return min for iterable values or None if empty."""
-    return min(values) if values else None
+
+def _details_min(obj, field):
+    """Return the minimum of a detail field computed by the database."""
+    return obj.details.aggregate(value=Min(field))["value"]
 
 
 def _offer_min_price(obj):
-    """Return the minimal offer price from details."""
-    return _min_or_none(obj.details.values_list("price", flat=True))
+    """Return the minimal offer price, preferring the queryset annotation."""
+    if hasattr(obj, "min_price"):
+        return obj.min_price
+    return _details_min(obj, "price")
 
 
 def _offer_min_delivery(obj):
-    """Return the minimal delivery time from offer details."""
-    return _min_or_none(obj.details.values_list("delivery_time_in_days", flat=True))
+    """Return the minimal delivery time, preferring the queryset annotation."""
+    if hasattr(obj, "min_delivery_time"):
+        return obj.min_delivery_time
+    return _details_min(obj, "delivery_time_in_days")
 
 
 def _build_user_details(user):
@@ -30,6 +43,15 @@ def _build_user_details(user):
     }
 
 
+def _absolute_url_prefix(context):
+    """Return scheme and host of the request, resolved once per serializer context."""
+    if "absolute_url_prefix" not in context:
+        request = context.get("request")
+        prefix = request.build_absolute_uri("/")[:-1] if request is not None else ""
+        context["absolute_url_prefix"] = prefix
+    return context["absolute_url_prefix"]
+
+
 def _require_offer_type(detail):
     """Return offer_type or raise a validation error."""
     offer_type = detail.get("offer_type")
@@ -39,11 +61,11 @@ def _require_offer_type(detail):
     return offer_type
 
 
-def _get_offer_detail(instance, offer_type):
-    """Fetch a detail by offer_type or raise a validation error."""
+def _get_offer_detail(details_by_type, offer_type):
+    """Return a detail by offer_type or raise a validation error."""
     try:
-        return instance.details.get(offer_type=offer_type)
-    except OfferDetail.DoesNotExist as exc:
+        return details_by_type[offer_type]
+    except KeyError as exc:
         raise serializers.ValidationError("Offer detail not found.") from exc
 
 
@@ -51,15 +73,27 @@ def _apply_detail_update(obj, detail):
     """Apply updated fields to an offer detail instance."""
     for field, value in detail.items():
         setattr(obj, field, value)
-    obj.save()
 
 
 def _update_offer_details(instance, details_data):
     """Update offer details based on incoming payload."""
-    for detail in details_data:
-        offer_type = _require_offer_type(detail)
-        obj = _get_offer_detail(instance, offer_type)
+    offer_types = [_require_offer_type(detail) for detail in details_data]
+    if not offer_types:
+        return
+    details_by_type = {
+        obj.offer_type: obj
+        for obj in instance.details.filter(offer_type__in=offer_types)
+    }
+    updated = {}
+    changed_fields = set()
+    for offer_type, detail in zip(offer_types, details_data):
+        obj = _get_offer_detail(details_by_type, offer_type)
         _apply_detail_update(obj, detail)
+        updated[offer_type] = obj
+        changed_fields.update(detail.keys())
+    fields = [field for field in DETAIL_UPDATE_FIELDS if field in changed_fields]
+    if fields:
+        OfferDetail.objects.bulk_update(updated.values(), fields)
 
 
 class OfferDetailSerializer(serializers.ModelSerializer):
@@ -86,16 +120,12 @@ class OfferDetailLinkSerializer(serializers.ModelSerializer):
         fields = ["id", "url"]
 
     def get_url(self, obj):
-        request = self.context.get("request")
-        path = f"/api/offerdetails/{obj.pk}/"
-        if request is None:
-            return path
-        return request.build_absolute_uri(path)
+        return f"{_absolute_url_prefix(self.context)}/api/offerdetails/{obj.pk}/"
 
 
 class OfferListSerializer(serializers.ModelSerializer):
     """Serializer for offer list results."""
-    user = serializers.IntegerField(source="user.id", read_only=True)
+    user = serializers.IntegerField(source="user_id", read_only=True)
     details = OfferDetailLinkSerializer(many=True, read_only=True)
     min_price = serializers.SerializerMethodField()
     min_delivery_time = serializers.SerializerMethodField()
@@ -129,7 +159,7 @@ class OfferListSerializer(serializers.ModelSerializer):
 
 class OfferDetailViewSerializer(serializers.ModelSerializer):
     """Serializer for offer detail views."""
-    user = serializers.IntegerField(source="user.id", read_only=True)
+    user = serializers.IntegerField(source="user_id", read_only=True)
     details = OfferDetailLinkSerializer(many=True, read_only=True)
     min_price = serializers.SerializerMethodField()
     min_delivery_time = serializers.SerializerMethodField()
@@ -168,6 +198,10 @@ class OfferCreateSerializer(serializers.ModelSerializer):
         if len(value) != 3:
             raise serializers.ValidationError(
                 "An offer must contain exactly 3 details.")
+        offer_types = {detail["offer_type"] for detail in value}
+        if len(offer_types) != len(value):
+            raise serializers.ValidationError(
+                "Each offer type may only be used once.")
         return value
 
     @transaction.atomic
@@ -175,8 +209,8 @@ class OfferCreateSerializer(serializers.ModelSerializer):
         details_data = validated_data.pop("details")
         user = self.context["request"].user
         offer = Offer.objects.create(user=user, **validated_data)
-        for detail in details_data:
-            OfferDetail.objects.create(offer=offer, **detail)
+        OfferDetail.objects.bulk_create(
+            [OfferDetail(offer=offer, **detail) for detail in details_data])
         return offer
 
 
@@ -186,7 +220,7 @@ class OfferUpdateSerializer(serializers.ModelSerializer):
 
     class Meta:
         model = Offer
-        fields = ["title", "image", "description", "details"]
+        fields = ["id", "title", "image", "description", "details"]
 
     @transaction.atomic
     def update(self, instance, validated_data):
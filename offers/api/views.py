@@ -2,21 +2,18 @@
 
 from decimal import Decimal, InvalidOperation
 
-from django.db.models import Min, Q
-from django.shortcuts import get_object_or_404
-from rest_framework import permissions, status
+from django.db.models import Min, Prefetch, Q
+from rest_framework import generics, permissions, status
 from rest_framework.response import Response
-from rest_framework.views import APIView
 
 from common.permissions import IsOfferOwner
 from common.utils import (
+    StandardResultsSetPagination,
     _apply_ordering,
-    _get_authenticated_user,
     _get_business_profile_or_response,
     _get_ordering_param,
-    _paginated_response,
 )
-from offers.models import Offer, OfferDetail
+from offers.models import OFFER_SEARCH_FIELDS, Offer, OfferDetail
 from offers.api.serializers import (
     OfferCreateSerializer,
     OfferDetailSerializer,
@@ -25,10 +22,52 @@ from offers.api.serializers import (
     OfferUpdateSerializer,
 )
 
+OFFER_COUNT_CACHE_KEY = "pagecount:offers"
+
+OFFER_PERMISSION_MESSAGES = {
+    "PATCH": "You do not have permission to modify this offer.",
+    "DELETE": "You do not have permission to delete this offer.",
+}
+
+
+def _parse_finite_decimal(value):
+    """Parse a decimal, rejecting NaN and infinities."""
+    number = Decimal(value)
+    if not number.is_finite():
+        raise ValueError(f"{value!r} is not a finite number.")
+    return number
+
+
+OFFER_FILTER_PARSERS = (
+    ("creator_id", int, "creator_id must be an integer."),
+    ("min_price", _parse_finite_decimal, "min_price must be a number."),
+    ("max_delivery_time", int, "max_delivery_time must be an integer."),
+)
+
+OFFER_LIST_FIELDS = [
+    "id",
+    "user",
+    "title",
+    "image",
+    "description",
+    "created_at",
+    "updated_at",
+    "user__id",
+    "user__username",
+    "user__first_name",
+    "user__last_name",
+]
+
+
+def _detail_links_prefetch():
+    """Prefetch only the detail columns needed to render detail links."""
+    return Prefetch("details", queryset=OfferDetail.objects.only("id", "offer_id"))
+
 
 def _offers_base_queryset():
-    """Return base offer queryset with prefetching."""
-    queryset = Offer.objects.all().prefetch_related("details")
+    """Return base offer queryset with related data preloaded."""
+    queryset = Offer.objects.select_related(
+        "user").prefetch_related(_detail_links_prefetch())
     return queryset.order_by("id")
 
 
@@ -40,187 +79,132 @@ def _annotate_offer_queryset(queryset):
     )
 
 
-def _filter_offers_by_creator(queryset, request):
-    """Filter offers by creator id query param."""
-    creator_id = request.query_params.get("creator_id")
-    if creator_id not in (None, ""):
+def _filter_offers_by_creator(queryset, filters):
+    """Filter offers by creator id."""
+    creator_id = filters.get("creator_id")
+    if creator_id is not None:
         return queryset.filter(user_id=creator_id)
     return queryset
 
 
-def _filter_offers_by_min_price(queryset, request):
-    """Filter offers by minimum price param."""
-    min_price = request.query_params.get("min_price")
-    if min_price not in (None, ""):
+def _filter_offers_by_min_price(queryset, filters):
+    """Filter offers by minimum price."""
+    min_price = filters.get("min_price")
+    if min_price is not None:
         return queryset.filter(min_price__gte=min_price)
     return queryset
 
 
-def _filter_offers_by_max_delivery(queryset, request):
-    """Filter offers by maximum delivery time param."""
-    max_delivery_time = request.query_params.get("max_delivery_time")
-    if max_delivery_time not in (None, ""):
+def _filter_offers_by_max_delivery(queryset, filters):
+    """Filter offers by maximum delivery time."""
+    max_delivery_time = filters.get("max_delivery_time")
+    if max_delivery_time is not None:
         return queryset.filter(min_delivery_time__lte=max_delivery_time)
     return queryset
 
 
-def _filter_offers_by_search(queryset, request):
-    """Filter offers by search term."""
-    search = request.query_params.get("search")
-    if search:
-        return queryset.filter(Q(title__icontains=search) | Q(description__icontains=search))
-    return queryset
-
-
-def _apply_offers_filters(queryset, request):
-    """Apply all offer filters from query params."""
-    queryset = _filter_offers_by_creator(queryset, request)
-    queryset = _filter_offers_by_min_price(queryset, request)
-    queryset = _filter_offers_by_max_delivery(queryset, request)
-    return _filter_offers_by_search(queryset, request)
-
-
-def _validate_offer_filters(request):
-    """Validate filter query params and return a response for bad input."""
-    creator_id = request.query_params.get("creator_id")
-    if creator_id not in (None, ""):
+def _filter_offers_by_search(queryset, filters):
+    """Filter offers by search term in title or description."""
+    search = filters.get("search")
+    if not search:
+        return queryset
+    # Served by the trigram indexes of offers migration 0004 on PostgreSQL.
+    query = Q()
+    for field in OFFER_SEARCH_FIELDS:
+        query |= Q(**{f"{field}__icontains": search})
+    return queryset.filter(query)
+
+
+def _apply_offers_filters(queryset, filters):
+    """Apply all parsed offer filters."""
+    queryset = _filter_offers_by_creator(queryset, filters)
+    queryset = _filter_offers_by_min_price(queryset, filters)
+    queryset = _filter_offers_by_max_delivery(queryset, filters)
+    return _filter_offers_by_search(queryset, filters)
+
+
+def _parse_offer_filters(request):
+    """Parse filter query params into typed values or return a 400 response."""
+    params = request.query_params
+    filters = {"search": params.get("search")}
+    for name, parse, message in OFFER_FILTER_PARSERS:
+        value = params.get(name)
+        if value in (None, ""):
+            continue
         try:
-            int(creator_id)
-        except (TypeError, ValueError):
-            return Response(
-                {"detail": "creator_id must be an integer."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
-
-    min_price = request.query_params.get("min_price")
-    if min_price not in (None, ""):
-        try:
-            Decimal(min_price)
+            filters[name] = parse(value)
         except (TypeError, ValueError, InvalidOperation):
-            return Response(
-                {"detail": "min_price must be a number."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
+            return None, Response(
+                {"detail": message}, status=status.HTTP_400_BAD_REQUEST)
+    return filters, None
 
-    max_delivery_time = request.query_params.get("max_delivery_time")
-    if max_delivery_time not in (None, ""):
-        try:
-            int(max_delivery_time)
-        except (TypeError, ValueError):
-            return Response(
-                {"detail": "max_delivery_time must be an integer."},
-                status=status.HTTP_400_BAD_REQUEST,
-            )
 
-    return None
-
-
-def _create_offer_from_request(request):
-    """Create an offer from request payload."""
-    serializer = OfferCreateSerializer(
-        data=request.data, context={"request": request})
-    serializer.is_valid(raise_exception=True)
-    return serializer.save()
-
-
-def _get_authenticated_user_or_response(request):
-    """Return authenticated user or a 401 response."""
-    user = _get_authenticated_user(request)
-    if not user:
-        return None, Response(
-            {"detail": "Authentication credentials were not provided."},
-            status=status.HTTP_401_UNAUTHORIZED,
-        )
-    return user, None
-
-
-class OffersListCreateView(APIView):
+class OffersListCreateView(generics.ListCreateAPIView):
     """List offers or create a new offer."""
     permission_classes = [permissions.IsAuthenticatedOrReadOnly]
+    pagination_class = StandardResultsSetPagination
+    ordering_fields = {"updated_at", "-updated_at", "min_price", "-min_price"}
+
+    def get_serializer_class(self):
+        if self.request.method == "POST":
+            return OfferCreateSerializer
+        return OfferListSerializer
 
-    def get(self, request):
-        allowed = {"updated_at", "-updated_at", "min_price", "-min_price"}
-        ordering, is_valid = _get_ordering_param(request, allowed)
+    def get_queryset(self):
+        queryset = _offers_base_queryset().only(*OFFER_LIST_FIELDS)
+        queryset = _annotate_offer_queryset(queryset)
+        queryset = _apply_offers_filters(queryset, getattr(self, "offer_filters", {}))
+        ordering, _ = _get_ordering_param(self.request, self.ordering_fields)
+        return _apply_ordering(queryset, ordering)
+
+    def get_count_cache_key(self):
+        """Cache the total only for the unfiltered list, invalidated on writes."""
+        filters = getattr(self, "offer_filters", {})
+        if all(value in (None, "") for value in filters.values()):
+            return OFFER_COUNT_CACHE_KEY
+        return None
+
+    def list(self, request, *args, **kwargs):
+        _, is_valid = _get_ordering_param(request, self.ordering_fields)
         if not is_valid:
             return Response(
                 {"detail": "Invalid ordering parameter."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        response = _validate_offer_filters(request)
+        self.offer_filters, response = _parse_offer_filters(request)
         if response:
             return response
-        queryset = _offers_base_queryset()
-        queryset = _annotate_offer_queryset(queryset)
-        queryset = _apply_offers_filters(queryset, request)
-        queryset = _apply_ordering(queryset, ordering)
-        return _paginated_response(request, queryset, OfferListSerializer)
+        return super().list(request, *args, **kwargs)
 
-    def post(self, request):
-        user, response = _get_authenticated_user_or_response(request)
-        if response:
-            return response
-        _, response = _get_business_profile_or_response(user)
+    def create(self, request, *args, **kwargs):
+        _, response = _get_business_profile_or_response(request.user)
         if response:
             return response
-        offer = _create_offer_from_request(request)
-        response_serializer = OfferCreateSerializer(
-            offer, context={"request": request})
-        return Response(response_serializer.data, status=status.HTTP_201_CREATED)
+        return super().create(request, *args, **kwargs)
 
 
-class OfferDetailUpdateDeleteView(APIView):
+class OfferDetailUpdateDeleteView(generics.RetrieveUpdateDestroyAPIView):
     """Retrieve, update, or delete an offer."""
-    permission_classes = [permissions.IsAuthenticated]
+    permission_classes = [permissions.IsAuthenticated, IsOfferOwner]
+    http_method_names = ["get", "patch", "delete", "head", "options"]
 
-    def get(self, request, pk):
-        _, response = _get_authenticated_user_or_response(request)
-        if response:
-            return response
-        offer = get_object_or_404(Offer, pk=pk)
-        serializer = OfferDetailViewSerializer(
-            offer, context={"request": request})
-        return Response(serializer.data)
+    def get_queryset(self):
+        if self.request.method in permissions.SAFE_METHODS:
+            return _annotate_offer_queryset(_offers_base_queryset())
+        return Offer.objects.all()
 
-    def patch(self, request, pk):
-        _, response = _get_authenticated_user_or_response(request)
-        if response:
-            return response
-        offer = get_object_or_404(Offer, pk=pk)
-        if not IsOfferOwner().has_object_permission(request, self, offer):
-            return Response(
-                {"detail": "You do not have permission to modify this offer."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-        serializer = OfferUpdateSerializer(
-            offer, data=request.data, partial=True, context={"request": request})
-        serializer.is_valid(raise_exception=True)
-        serializer.save()
-        response_serializer = OfferCreateSerializer(
-            offer, context={"request": request})
-        return Response(response_serializer.data, status=status.HTTP_200_OK)
-
-    def delete(self, request, pk):
-        _, response = _get_authenticated_user_or_response(request)
-        if response:
-            return response
-        offer = get_object_or_404(Offer, pk=pk)
-        if not IsOfferOwner().has_object_permission(request, self, offer):
-            return Response(
-                {"detail": "You do not have permission to delete this offer."},
-                status=status.HTTP_403_FORBIDDEN,
-            )
-        offer.delete()
-        return Response(status=status.HTTP_204_NO_CONTENT)
+    def get_serializer_class(self):
+        if self.request.method in permissions.SAFE_METHODS:
+            return OfferDetailViewSerializer
+        return OfferUpdateSerializer
+
+    def permission_denied(self, request, message=None, code=None):
+        message = OFFER_PERMISSION_MESSAGES.get(request.method, message)
+        super().permission_denied(request, message=message, code=code)
 
 
-class OfferDetailRetrieveView(APIView):
+class OfferDetailRetrieveView(generics.RetrieveAPIView):
     """Retrieve a single offer detail record."""
     permission_classes = [permissions.IsAuthenticated]
-
-    def get(self, request, pk):
-        _, response = _get_authenticated_user_or_response(request)
-        if response:
-            return response
-        detail = get_object_or_404(OfferDetail, pk=pk)
-        serializer = OfferDetailSerializer(detail)
-        return Response(serializer.data)
+    queryset = OfferDetail.objects.all()
+    serializer_class = OfferDetailSerializer
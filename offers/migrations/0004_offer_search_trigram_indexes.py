@@ -0,0 +1,44 @@
+# Generated by Django 6.0.1 on 2026-10-16 09:12
+
+from django.contrib.postgres.indexes import GinIndex, OpClass
+from django.db import migrations
+from django.db.models.functions import Upper
+
+
+def _search_indexes():
+    # icontains compiles to UPPER(column::text) LIKE UPPER(...), so the
+    # indexed expression must be UPPER(column) for the planner to use it.
+    return [
+        GinIndex(OpClass(Upper("title"), name="gin_trgm_ops"),
+                 name="offer_title_trgm_idx"),
+        GinIndex(OpClass(Upper("description"), name="gin_trgm_ops"),
+                 name="offer_description_trgm_idx"),
+    ]
+
+
+def create_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    schema_editor.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    offer = apps.get_model("offers", "Offer")
+    for index in _search_indexes():
+        schema_editor.add_index(offer, index)
+
+
+def drop_search_indexes(apps, schema_editor):
+    if schema_editor.connection.vendor != "postgresql":
+        return
+    offer = apps.get_model("offers", "Offer")
+    for index in _search_indexes():
+        schema_editor.remove_index(offer, index)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('offers', '0003_offerdetail_indexes'),
+    ]
+
+    operations = [
+        migrations.RunPython(create_search_indexes, drop_search_indexes),
+    ]
@@ -3,6 +3,8 @@
 from django.conf import settings
 from django.db import models
 
+OFFER_SEARCH_FIELDS = ("title", "description")
+
 
 class Offer(models.Model):
     """Offer created by a business user."""
@@ -14,6 +16,14 @@ class Offer(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["user", "updated_at"],
+                         name="offer_user_updated_idx"),
+            models.Index(fields=["updated_at", "id"],
+                         name="offer_updated_id_idx"),
+        ]
+
     def __str__(self) -> str:
         return self.title
 
@@ -38,5 +48,17 @@ class OfferDetail(models.Model):
     features = models.JSONField(default=list, blank=True)
     offer_type = models.CharField(max_length=20, choices=OFFER_TYPE_CHOICES)
 
+    class Meta:
+        constraints = [
+            models.UniqueConstraint(fields=["offer", "offer_type"],
+                                    name="uniq_offer_offertype"),
+        ]
+        indexes = [
+            models.Index(fields=["offer", "price"],
+                         name="offerdetail_offer_price_idx"),
+            models.Index(fields=["offer", "delivery_time_in_days"],
+                         name="offerdetail_offer_delivery_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"{self.offer.title} - {self.offer_type}"
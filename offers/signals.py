@@ -0,0 +1,14 @@
+"""Signal handlers that keep the cached offer count fresh."""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from offers.api.views import OFFER_COUNT_CACHE_KEY
+from offers.models import Offer
+
+
+@receiver([post_save, post_delete], sender=Offer)
+def invalidate_offer_count(sender, **kwargs):
+    """Drop the cached offer list count when an offer is added or removed."""
+    cache.delete(OFFER_COUNT_CACHE_KEY)
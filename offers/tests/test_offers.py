@@ -1,49 +1,68 @@
-from copy import deepcopy
+import json
+import tempfile
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.db import connection
+from django.test import override_settings
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.test import APIClient, APITestCase
+
+from offers.api.serializers import OfferDetailViewSerializer
+from offers.models import Offer, OfferDetail
+
+
+User = get_user_model()
+
+
+# The API authenticates in DRF itself; the browser-facing middleware
+# stack adds nothing to these tests.
+api_only_middleware = override_settings(MIDDLEWARE=[])
+
+
+PAGINATION_KEYS = frozenset({"count", "next", "previous", "results"})
+
+
+OFFER_DETAIL_KEYS = frozenset({
+    "id",
+    "user",
+    "title",
+    "image",
+    "description",
+    "created_at",
+    "updated_at",
+    "details",
+    "min_price",
+    "min_delivery_time",
+})
+
+
+OFFER_LIST_ITEM_KEYS = OFFER_DETAIL_KEYS | {"user_details"}
+
+
+OFFER_DETAIL_ITEM_KEYS = frozenset({
+    "id",
+    "title",
+    "revisions",
+    "delivery_time_in_days",
+    "price",
+    "features",
+    "offer_type",
+})
 
 
 def _assert_pagination_payload(testcase, data):
-    for key in ["count", "next", "previous", "results"]:
-        testcase.assertIn(key, data)
+    testcase.assertFalse(PAGINATION_KEYS - data.keys(), "missing keys")
     testcase.assertIsInstance(data["results"], list)
 
 
 def _assert_offer_list_item(testcase, item):
-    expected_keys = {
-        "id",
-        "user",
-        "title",
-        "image",
-        "description",
-        "created_at",
-        "updated_at",
-        "details",
-        "min_price",
-        "min_delivery_time",
-        "user_details",
-    }
-    for key in expected_keys:
-        testcase.assertIn(key, item)
+    testcase.assertFalse(OFFER_LIST_ITEM_KEYS - item.keys(), "missing keys")
 
 
 def _assert_offer_detail_response(testcase, data):
-    expected_keys = {
-        "id",
-        "user",
-        "title",
-        "image",
-        "description",
-        "created_at",
-        "updated_at",
-        "details",
-        "min_price",
-        "min_delivery_time",
-    }
-    for key in expected_keys:
-        testcase.assertIn(key, data)
+    testcase.assertFalse(OFFER_DETAIL_KEYS - data.keys(), "missing keys")
     testcase.assertIsInstance(data["details"], list)
 
 
@@ -78,30 +97,30 @@ OFFER_PAYLOAD = {
     "image": None,
     "description": "Ein umfassendes Grafikdesign-Paket für Unternehmen.",
     "details": [
-                {
-                    "title": "Basic Design",
-                    "revisions": 2,
-                    "delivery_time_in_days": 5,
-                    "price": 100,
-                    "features": ["Logo Design", "Visitenkarte"],
-                    "offer_type": "basic",
-                },
         {
-                    "title": "Standard Design",
-                    "revisions": 5,
-                    "delivery_time_in_days": 7,
-                    "price": 200,
-                    "features": ["Logo Design", "Visitenkarte", "Briefpapier"],
-                    "offer_type": "standard",
-                },
+            "title": "Basic Design",
+            "revisions": 2,
+            "delivery_time_in_days": 5,
+            "price": 100,
+            "features": ["Logo Design", "Visitenkarte"],
+            "offer_type": "basic",
+        },
+        {
+            "title": "Standard Design",
+            "revisions": 5,
+            "delivery_time_in_days": 7,
+            "price": 200,
+            "features": ["Logo Design", "Visitenkarte", "Briefpapier"],
+            "offer_type": "standard",
+        },
         {
-                    "title": "Premium Design",
-                    "revisions": 10,
-                    "delivery_time_in_days": 10,
-                    "price": 500,
-                    "features": ["Logo Design", "Visitenkarte", "Briefpapier", "Flyer"],
-                    "offer_type": "premium",
-                },
+            "title": "Premium Design",
+            "revisions": 10,
+            "delivery_time_in_days": 10,
+            "price": 500,
+            "features": ["Logo Design", "Visitenkarte", "Briefpapier", "Flyer"],
+            "offer_type": "premium",
+        },
     ],
 }
 
@@ -121,21 +140,41 @@ OFFER_UPDATE_PAYLOAD = {
 }
 
 
-def _build_offer_payload():
-    return deepcopy(OFFER_PAYLOAD)
+OFFER_PAYLOAD_BODY = json.dumps(OFFER_PAYLOAD).encode()
+OFFER_UPDATE_PAYLOAD_BODY = json.dumps(OFFER_UPDATE_PAYLOAD).encode()
+
+
+def _authenticated_client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+def _file_cache_settings(location):
+    """Return CACHES using a file cache, which every worker process shares."""
+    return {"default": {
+        "BACKEND": "django.core.cache.backends.filebased.FileBasedCache",
+        "LOCATION": location,
+    }}
 
 
-def _build_offer_update_payload():
-    return deepcopy(OFFER_UPDATE_PAYLOAD)
+def _create_user(username, email, **kwargs):
+    return User.objects.create_user(username=username, email=email, **kwargs)
 
 
-def _create_user(user_model, username, email, password, **kwargs):
-    return user_model.objects.create_user(username=username, email=email, password=password, **kwargs)
+def _create_offer_with_details(owner, payload=OFFER_PAYLOAD):
+    offer = Offer.objects.create(
+        user=owner, title=payload["title"], description=payload["description"])
+    details = OfferDetail.objects.bulk_create(
+        [OfferDetail(offer=offer, **detail) for detail in payload["details"]])
+    return offer, details
 
 
+@api_only_middleware
 class OffersListApiTests(APITestCase):
     def setUp(self):
         self.url = "/api/offers/"
+        cache.clear()
 
     def test_get_offers_list_success_with_pagination_structure(self):
         response = self.client.get(self.url)
@@ -146,6 +185,140 @@ class OffersListApiTests(APITestCase):
         if data["results"]:
             _assert_offer_list_item(self, data["results"][0])
 
+    def test_get_offers_list_min_values_from_details(self):
+        owner = _create_user("list_owner", "list_owner@example.com")
+        _create_offer_with_details(owner)
+
+        response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        item = response.json()["results"][0]
+        self.assertEqual(float(item["min_price"]), 100)
+        self.assertEqual(item["min_delivery_time"], 5)
+
+    def test_get_offers_list_query_count_independent_of_page_size(self):
+        for index in range(3):
+            owner = _create_user(f"count_owner{index}", f"count_owner{index}@example.com")
+            _create_offer_with_details(owner)
+
+        for page_size, expected_rows in ((1, 1), (100, 3)):
+            with self.subTest(page_size=page_size):
+                # Count, offer page joined with users, one prefetch for detail links.
+                with self.assertNumQueries(3):
+                    response = self.client.get(self.url, {"page_size": page_size})
+
+                self.assertEqual(response.status_code, status.HTTP_200_OK)
+                self.assertEqual(len(response.json()["results"]), expected_rows)
+
+    def test_get_offers_list_later_pages_reuse_shared_cached_count(self):
+        owner = _create_user("page_owner", "page_owner@example.com")
+        for _ in range(2):
+            _create_offer_with_details(owner)
+
+        with tempfile.TemporaryDirectory() as location, \
+                self.settings(CACHES=_file_cache_settings(location)):
+            first = self.client.get(self.url, {"page_size": 1})
+            with self.assertNumQueries(2):
+                second = self.client.get(self.url, {"page": 2, "page_size": 1})
+
+        self.assertEqual(second.status_code, status.HTTP_200_OK)
+        self.assertEqual(second.json()["count"], first.json()["count"])
+        self.assertIsNone(second.json()["next"])
+
+    def test_get_offers_list_later_pages_count_new_offers(self):
+        owner = _create_user("grow_owner", "grow_owner@example.com")
+        _create_offer_with_details(owner)
+
+        with tempfile.TemporaryDirectory() as location, \
+                self.settings(CACHES=_file_cache_settings(location)):
+            self.client.get(self.url, {"page_size": 1})
+            _create_offer_with_details(owner)
+            response = self.client.get(self.url, {"page": 2, "page_size": 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 2)
+
+    def test_get_offers_list_later_pages_recount_with_process_local_cache(self):
+        owner = _create_user("local_owner", "local_owner@example.com")
+        _create_offer_with_details(owner)
+        self.client.get(self.url, {"page_size": 1})
+        # bulk_create sends no post_save, like a write handled by another worker.
+        Offer.objects.bulk_create([Offer(user=owner, title="Unsignalled offer")])
+
+        response = self.client.get(self.url, {"page": 2, "page_size": 1})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["count"], 2)
+
+    def test_get_offers_list_filters_by_min_price_and_delivery(self):
+        owner = _create_user("filter_owner", "filter_owner@example.com")
+        _create_offer_with_details(owner)
+
+        matching = self.client.get(self.url, {"min_price": "99.5", "max_delivery_time": "5"})
+        excluded = self.client.get(self.url, {"min_price": "100.01"})
+
+        self.assertEqual(matching.json()["count"], 1)
+        self.assertEqual(excluded.json()["count"], 0)
+
+    def test_get_offers_list_pages_tied_ordering_without_repeats(self):
+        owner = _create_user("tie_owner", "tie_owner@example.com")
+        for _ in range(3):
+            _create_offer_with_details(owner)
+
+        ids = [
+            self.client.get(self.url, {"ordering": "min_price", "page_size": 1, "page": page})
+            .json()["results"][0]["id"]
+            for page in (1, 2, 3)
+        ]
+
+        self.assertEqual(ids, sorted(ids))
+        self.assertEqual(len(set(ids)), 3)
+
+    def test_get_offers_list_breaks_descending_ties_by_descending_id(self):
+        owner = _create_user("desc_tie_owner", "desc_tie_owner@example.com")
+        for _ in range(3):
+            _create_offer_with_details(owner)
+
+        response = self.client.get(self.url, {"ordering": "-min_price"})
+
+        ids = [offer["id"] for offer in response.json()["results"]]
+        self.assertEqual(ids, sorted(ids, reverse=True))
+
+    def test_get_offers_list_skips_unrendered_user_columns(self):
+        owner = _create_user("only_owner", "only_owner@example.com")
+        _create_offer_with_details(owner)
+
+        with CaptureQueriesContext(connection) as queries:
+            response = self.client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["results"][0]["user_details"]["username"],
+                         "only_owner")
+        self.assertFalse(
+            any("password" in query["sql"] for query in queries.captured_queries))
+
+    def test_get_offers_list_search_matches_title(self):
+        owner = _create_user("search_owner", "search_owner@example.com")
+        Offer.objects.create(user=owner, title="Website Design")
+        Offer.objects.create(user=owner, title="Logo Design")
+
+        response = self.client.get(self.url, {"search": "website"})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        titles = [item["title"] for item in response.json()["results"]]
+        self.assertEqual(titles, ["Website Design"])
+
+    def test_get_offers_list_search_matches_word_fragments(self):
+        owner = _create_user("fragment_owner", "fragment_owner@example.com")
+        Offer.objects.create(user=owner, title="Programmierung",
+                             description="Webentwicklung mit Django")
+        Offer.objects.create(user=owner, title="Logo Design")
+
+        response = self.client.get(self.url, {"search": "Web"})
+
+        titles = [item["title"] for item in response.json()["results"]]
+        self.assertEqual(titles, ["Programmierung"])
+
     def test_get_offers_list_invalid_ordering_returns_400(self):
         response = self.client.get(self.url, {"ordering": "invalid_field"})
 
@@ -156,6 +329,15 @@ class OffersListApiTests(APITestCase):
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
+    def test_get_offers_list_non_finite_min_price_returns_400(self):
+        for value in ("NaN", "Infinity", "-Infinity", "sNaN"):
+            with self.subTest(min_price=value):
+                response = self.client.get(self.url, {"min_price": value})
+
+                self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+                self.assertEqual(
+                    response.json(), {"detail": "min_price must be a number."})
+
     def test_get_offers_list_invalid_max_delivery_time_returns_400(self):
         response = self.client.get(self.url, {"max_delivery_time": "invalid"})
 
@@ -167,55 +349,69 @@ class OffersListApiTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
 
+@api_only_middleware
 class OffersCreateApiTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.business_user = _create_user("biz_user", "biz_user@example.com")
+        cls.customer_user = _create_user("customer_user", "customer_user@example.com")
+
     def setUp(self):
-        self.user_model = get_user_model()
-        self.business_user = _create_user(
-            self.user_model, "biz_user", "biz_user@example.com", "testpass123")
-        self.customer_user = _create_user(
-            self.user_model, "customer_user", "customer_user@example.com", "testpass123")
+        self.business_client = _authenticated_client(self.business_user)
+        self.customer_client = _authenticated_client(self.customer_user)
         self.url = "/api/offers/"
-        self.payload = _build_offer_payload()
+        self.payload = OFFER_PAYLOAD
 
     def test_create_offer_requires_authentication(self):
-        response = self.client.post(self.url, self.payload, format="json")
+        response = self.client.post(
+            self.url, OFFER_PAYLOAD_BODY, content_type="application/json")
 
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
     def test_create_offer_forbidden_for_non_business(self):
-        self.client.force_authenticate(user=self.customer_user)
-
-        response = self.client.post(self.url, self.payload, format="json")
+        response = self.customer_client.post(
+            self.url, OFFER_PAYLOAD_BODY, content_type="application/json")
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_create_offer_requires_three_details(self):
-        self.client.force_authenticate(user=self.business_user)
         payload = {**self.payload, "details": self.payload["details"][:2]}
 
-        response = self.client.post(self.url, payload, format="json")
+        response = self.business_client.post(self.url, payload, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            response.json(),
+            {"details": ["An offer must contain exactly 3 details."]})
 
-    def test_create_offer_success(self):
-        self.client.force_authenticate(user=self.business_user)
+    def test_create_offer_duplicate_offer_types_returns_400(self):
+        details = [{**detail, "offer_type": "basic"}
+                   for detail in self.payload["details"]]
+        payload = {**self.payload, "details": details}
+
+        response = self.business_client.post(self.url, payload, format="json")
 
-        response = self.client.post(self.url, self.payload, format="json")
+        self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
+
+    def test_create_offer_success(self):
+        response = self.business_client.post(
+            self.url, OFFER_PAYLOAD_BODY, content_type="application/json")
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         data = response.json()
         _assert_offer_create_response(self, data, self.payload)
 
 
+@api_only_middleware
 class OffersDetailApiTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.business_user = _create_user("biz_detail_user", "biz_detail_user@example.com")
+        cls.other_user = _create_user("other_offer_user", "other_offer_user@example.com")
+
     def setUp(self):
-        self.user_model = get_user_model()
-        self.business_user = _create_user(
-            self.user_model, "biz_detail_user", "biz_detail_user@example.com", "testpass123")
-        self.other_user = _create_user(
-            self.user_model, "other_offer_user", "other_offer_user@example.com", "testpass123")
+        self.business_client = _authenticated_client(self.business_user)
         self.url_base = "/api/offers/"
-        self.payload = _build_offer_payload()
 
     def test_get_offer_detail_requires_authentication(self):
         response = self.client.get(f"{self.url_base}1/")
@@ -223,21 +419,14 @@ class OffersDetailApiTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
     def test_get_offer_detail_not_found(self):
-        self.client.force_authenticate(user=self.business_user)
-
-        response = self.client.get(f"{self.url_base}999999/")
+        response = self.business_client.get(f"{self.url_base}999999/")
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_get_offer_detail_success(self):
-        self.client.force_authenticate(user=self.business_user)
-
-        create_response = self.client.post(
-            self.url_base, self.payload, format="json")
-        self.assertEqual(create_response.status_code, status.HTTP_201_CREATED)
-        offer_id = create_response.json().get("id")
+        offer, _ = _create_offer_with_details(self.business_user)
 
-        response = self.client.get(f"{self.url_base}{offer_id}/")
+        response = self.business_client.get(f"{self.url_base}{offer.pk}/")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         data = response.json()
@@ -245,54 +434,61 @@ class OffersDetailApiTests(APITestCase):
         if data["details"]:
             _assert_offer_detail_link(self, data["details"][0])
 
+    def test_get_offer_detail_links_are_absolute(self):
+        offer, details = _create_offer_with_details(self.business_user)
 
+        response = self.business_client.get(f"{self.url_base}{offer.pk}/")
+
+        urls = [detail["url"] for detail in response.json()["details"]]
+        self.assertEqual(urls, [
+            f"http://testserver/api/offerdetails/{detail.pk}/" for detail in details])
+
+
+@api_only_middleware
 class OffersUpdateApiTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner_user = _create_user("owner_user", "owner_user@example.com")
+        cls.other_user = _create_user("not_owner_user", "not_owner_user@example.com")
+
     def setUp(self):
-        self.user_model = get_user_model()
-        self.owner_user = _create_user(
-            self.user_model, "owner_user", "owner_user@example.com", "testpass123")
-        self.other_user = _create_user(
-            self.user_model, "not_owner_user", "not_owner_user@example.com", "testpass123")
+        self.owner_client = _authenticated_client(self.owner_user)
+        self.other_client = _authenticated_client(self.other_user)
         self.url_base = "/api/offers/"
-        self.create_payload = _build_offer_payload()
-        self.update_payload = _build_offer_update_payload()
+        self.update_payload = OFFER_UPDATE_PAYLOAD
 
     def _create_offer(self):
-        self.client.force_authenticate(user=self.owner_user)
-        response = self.client.post(
-            self.url_base, self.create_payload, format="json")
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        return response.json().get("id")
+        offer, _ = _create_offer_with_details(self.owner_user)
+        return offer.pk
 
     def test_patch_offer_requires_authentication(self):
         response = self.client.patch(
-            f"{self.url_base}1/", self.update_payload, format="json")
+            f"{self.url_base}1/", OFFER_UPDATE_PAYLOAD_BODY, content_type="application/json")
 
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
     def test_patch_offer_not_found(self):
-        self.client.force_authenticate(user=self.owner_user)
-
-        response = self.client.patch(
-            f"{self.url_base}999999/", self.update_payload, format="json")
+        response = self.owner_client.patch(
+            f"{self.url_base}999999/", OFFER_UPDATE_PAYLOAD_BODY, content_type="application/json")
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_patch_offer_forbidden_for_non_owner(self):
         offer_id = self._create_offer()
-        self.client.force_authenticate(user=self.other_user)
 
-        response = self.client.patch(
-            f"{self.url_base}{offer_id}/", self.update_payload, format="json")
+        response = self.other_client.patch(
+            f"{self.url_base}{offer_id}/", OFFER_UPDATE_PAYLOAD_BODY, content_type="application/json")
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(
+            response.json(),
+            {"detail": "You do not have permission to modify this offer."})
 
     def test_patch_offer_success(self):
         offer_id = self._create_offer()
-        self.client.force_authenticate(user=self.owner_user)
 
-        response = self.client.patch(
-            f"{self.url_base}{offer_id}/", self.update_payload, format="json")
+        response = self.owner_client.patch(
+            f"{self.url_base}{offer_id}/", OFFER_UPDATE_PAYLOAD_BODY, content_type="application/json")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         data = response.json()
@@ -300,22 +496,21 @@ class OffersUpdateApiTests(APITestCase):
             self, data, offer_id, self.update_payload)
 
 
+@api_only_middleware
 class OffersDeleteApiTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.owner_user = _create_user("delete_owner", "delete_owner@example.com")
+        cls.other_user = _create_user("delete_other", "delete_other@example.com")
+
     def setUp(self):
-        self.user_model = get_user_model()
-        self.owner_user = _create_user(
-            self.user_model, "delete_owner", "delete_owner@example.com", "testpass123")
-        self.other_user = _create_user(
-            self.user_model, "delete_other", "delete_other@example.com", "testpass123")
+        self.owner_client = _authenticated_client(self.owner_user)
+        self.other_client = _authenticated_client(self.other_user)
         self.url_base = "/api/offers/"
-        self.create_payload = _build_offer_payload()
 
     def _create_offer(self):
-        self.client.force_authenticate(user=self.owner_user)
-        response = self.client.post(
-            self.url_base, self.create_payload, format="json")
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        return response.json().get("id")
+        offer, _ = _create_offer_with_details(self.owner_user)
+        return offer.pk
 
     def test_delete_offer_requires_authentication(self):
         response = self.client.delete(f"{self.url_base}1/")
@@ -323,47 +518,43 @@ class OffersDeleteApiTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
     def test_delete_offer_not_found(self):
-        self.client.force_authenticate(user=self.owner_user)
-
-        response = self.client.delete(f"{self.url_base}999999/")
+        response = self.owner_client.delete(f"{self.url_base}999999/")
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_delete_offer_forbidden_for_non_owner(self):
         offer_id = self._create_offer()
-        self.client.force_authenticate(user=self.other_user)
 
-        response = self.client.delete(f"{self.url_base}{offer_id}/")
+        response = self.other_client.delete(f"{self.url_base}{offer_id}/")
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
+        self.assertEqual(
+            response.json(),
+            {"detail": "You do not have permission to delete this offer."})
+        self.assertTrue(Offer.objects.filter(pk=offer_id).exists())
 
     def test_delete_offer_success_returns_204_no_content(self):
         offer_id = self._create_offer()
-        self.client.force_authenticate(user=self.owner_user)
 
-        response = self.client.delete(f"{self.url_base}{offer_id}/")
+        response = self.owner_client.delete(f"{self.url_base}{offer_id}/")
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertEqual(response.content, b"")
 
 
+@api_only_middleware
 class OfferDetailsRetrieveApiTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.business_user = _create_user("detail_owner", "detail_owner@example.com")
+
     def setUp(self):
-        self.user_model = get_user_model()
-        self.business_user = _create_user(
-            self.user_model, "detail_owner", "detail_owner@example.com", "testpass123")
-        self.offers_url = "/api/offers/"
+        self.business_client = _authenticated_client(self.business_user)
         self.details_url_base = "/api/offerdetails/"
-        self.create_payload = _build_offer_payload()
 
     def _create_offer_and_get_detail_id(self):
-        self.client.force_authenticate(user=self.business_user)
-        response = self.client.post(
-            self.offers_url, self.create_payload, format="json")
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        details = response.json().get("details", [])
-        self.assertTrue(details)
-        return details[0].get("id")
+        _, details = _create_offer_with_details(self.business_user)
+        return details[0].pk
 
     def test_get_offerdetail_requires_authentication(self):
         response = self.client.get(f"{self.details_url_base}1/")
@@ -371,28 +562,26 @@ class OfferDetailsRetrieveApiTests(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
     def test_get_offerdetail_not_found(self):
-        self.client.force_authenticate(user=self.business_user)
-
-        response = self.client.get(f"{self.details_url_base}999999/")
+        response = self.business_client.get(f"{self.details_url_base}999999/")
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_get_offerdetail_success(self):
         detail_id = self._create_offer_and_get_detail_id()
-        self.client.force_authenticate(user=self.business_user)
 
-        response = self.client.get(f"{self.details_url_base}{detail_id}/")
+        response = self.business_client.get(f"{self.details_url_base}{detail_id}/")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         data = response.json()
-        expected_keys = {
-            "id",
-            "title",
-            "revisions",
-            "delivery_time_in_days",
-            "price",
-            "features",
-            "offer_type",
-        }
-        for key in expected_keys:
-            self.assertIn(key, data)
+        self.assertFalse(OFFER_DETAIL_ITEM_KEYS - data.keys(), "missing keys")
+
+
+class OfferMinValuesFallbackTests(APITestCase):
+    def test_unannotated_offer_min_values_from_aggregate(self):
+        owner = _create_user("fallback_owner", "fallback_owner@example.com")
+        offer, _ = _create_offer_with_details(owner)
+
+        data = OfferDetailViewSerializer(Offer.objects.get(pk=offer.pk)).data
+
+        self.assertEqual(data["min_price"], 100)
+        self.assertEqual(data["min_delivery_time"], 5)
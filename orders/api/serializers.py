@@ -5,11 +5,26 @@ from rest_framework import serializers
 from offers.models import OfferDetail
 from orders.models import Order
 
+ORDER_SOURCE_DETAIL_FIELDS = [
+    "title",
+    "revisions",
+    "delivery_time_in_days",
+    "price",
+    "features",
+    "offer_type",
+    "offer__user",
+]
+
+
+def _offer_details_for_orders():
+    """Return offer details loading only the columns copied into an order."""
+    return OfferDetail.objects.select_related("offer").only(*ORDER_SOURCE_DETAIL_FIELDS)
+
 
 def _get_offer_detail_by_id(offer_detail_id):
     """Return offer detail by id or raise a validation error."""
     try:
-        return OfferDetail.objects.select_related("offer", "offer__user").get(pk=offer_detail_id)
+        return _offer_details_for_orders().get(pk=offer_detail_id)
     except OfferDetail.DoesNotExist as exc:
         raise serializers.ValidationError(
             {"offer_detail_id": "Not found."}) from exc
@@ -19,7 +34,7 @@ def _create_order_from_detail(offer_detail, user):
     """Create an order from an offer detail for the given user."""
     return Order.objects.create(
         customer_user=user,
-        business_user=offer_detail.offer.user,
+        business_user_id=offer_detail.offer.user_id,
         title=offer_detail.title,
         revisions=offer_detail.revisions,
         delivery_time_in_days=offer_detail.delivery_time_in_days,
@@ -3,6 +3,7 @@ from django.urls import path
 from orders.api.views import (
     CompletedOrderCountView,
     OrderCountView,
+    OrderStatsView,
     OrdersListCreateView,
     OrdersUpdateDeleteView,
 )
@@ -13,4 +14,5 @@ urlpatterns = [
     path("order-count/<int:business_user_id>/", OrderCountView.as_view()),
     path("completed-order-count/<int:business_user_id>/",
          CompletedOrderCountView.as_view()),
+    path("order-stats/<int:business_user_id>/", OrderStatsView.as_view()),
 ]
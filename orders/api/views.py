@@ -1,21 +1,57 @@
 """Order views."""
 
 from django.contrib.auth import get_user_model
-from django.db.models import Q
+from django.core.cache import cache
+from django.db.models import Count, Q
 from django.shortcuts import get_object_or_404
 from rest_framework import permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
-from common.permissions import IsCustomerUser, IsOrderBusinessOwner, IsStaffUser
-from common.utils import _get_or_create_profile
-from offers.models import OfferDetail
+from common.permissions import (
+    IsCustomerUser,
+    IsOrderBusinessOwner,
+    IsStaffUser,
+    _get_profile_type,
+)
+from common.utils import _optionally_paginated_response
 from orders.models import Order
 from profiles.models import Profile
-from orders.api.serializers import OrderSerializer, OrderStatusUpdateSerializer
+from orders.api.serializers import (
+    OrderSerializer,
+    OrderStatusUpdateSerializer,
+    _offer_details_for_orders,
+)
 
 User = get_user_model()
 
+ORDER_COUNT_CACHE_TIMEOUT = 30
+
+
+def _order_count_cache_key(business_user_id, order_status):
+    """Return the cache key for a business user's order count by status."""
+    return f"orders:{business_user_id}:{order_status}"
+
+
+def _cached_order_counts(business_user_id, *order_statuses):
+    """Return order counts per status for a business user, cached briefly."""
+    keys = {
+        order_status: _order_count_cache_key(business_user_id, order_status)
+        for order_status in order_statuses
+    }
+    cached = cache.get_many(keys.values())
+    if len(cached) == len(keys):
+        return {order_status: cached[key] for order_status, key in keys.items()}
+    counts = Order.objects.filter(business_user_id=business_user_id).aggregate(
+        **{
+            order_status: Count("id", filter=Q(status=order_status))
+            for order_status in order_statuses
+        }
+    )
+    cache.set_many({keys[s]: counts[s] for s in order_statuses},
+                   ORDER_COUNT_CACHE_TIMEOUT)
+    return counts
+
 
 def _orders_for_user(user):
     """Return orders where user is customer or business."""
@@ -31,7 +67,7 @@ def _get_offer_detail_or_response(request):
         )
     try:
         offer_detail_id = request.data.get("offer_detail_id")
-        offer_detail = get_object_or_404(OfferDetail, pk=offer_detail_id)
+        offer_detail = get_object_or_404(_offer_details_for_orders(), pk=offer_detail_id)
     except (TypeError, ValueError):
         return None, Response(
             {"detail": "offer_detail_id must be an integer."},
@@ -40,11 +76,23 @@ def _get_offer_detail_or_response(request):
     return offer_detail, None
 
 
+def _business_user_not_found_response(business_user_id):
+    """Return a 404 response unless the id belongs to a business user."""
+    users = User.objects.select_related("profile")
+    user = get_object_or_404(users, pk=business_user_id)
+    if _get_profile_type(user) != Profile.TYPE_BUSINESS:
+        return Response(
+            {"detail": "Business user not found."},
+            status=status.HTTP_404_NOT_FOUND,
+        )
+    return None
+
+
 def _create_order_from_detail(customer_user, offer_detail):
     """Create an order for a given offer detail."""
     return Order.objects.create(
         customer_user=customer_user,
-        business_user=offer_detail.offer.user,
+        business_user_id=offer_detail.offer.user_id,
         title=offer_detail.title,
         revisions=offer_detail.revisions,
         delivery_time_in_days=offer_detail.delivery_time_in_days,
@@ -60,7 +108,7 @@ class OrdersListCreateView(APIView):
 
     def get(self, request):
         queryset = _orders_for_user(request.user)
-        return Response(OrderSerializer(queryset, many=True).data)
+        return _optionally_paginated_response(request, queryset, OrderSerializer)
 
     def post(self, request):
         if not IsCustomerUser().has_permission(request, self):
@@ -108,17 +156,12 @@ class OrderCountView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, business_user_id):
-        user = get_object_or_404(User, pk=business_user_id)
-        profile = _get_or_create_profile(user)
-        if profile.type != Profile.TYPE_BUSINESS:
-            return Response(
-                {"detail": "Business user not found."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-        count = Order.objects.filter(
-            business_user_id=business_user_id, status=Order.STATUS_IN_PROGRESS
-        ).count()
-        return Response({"order_count": count})
+        response = _business_user_not_found_response(business_user_id)
+        if response:
+            return response
+        counts = _cached_order_counts(
+            business_user_id, Order.STATUS_IN_PROGRESS)
+        return Response({"order_count": counts[Order.STATUS_IN_PROGRESS]})
 
 
 class CompletedOrderCountView(APIView):
@@ -126,14 +169,25 @@ class CompletedOrderCountView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request, business_user_id):
-        user = get_object_or_404(User, pk=business_user_id)
-        profile = _get_or_create_profile(user)
-        if profile.type != Profile.TYPE_BUSINESS:
-            return Response(
-                {"detail": "Business user not found."},
-                status=status.HTTP_404_NOT_FOUND,
-            )
-        count = Order.objects.filter(
-            business_user_id=business_user_id, status=Order.STATUS_COMPLETED
-        ).count()
-        return Response({"completed_order_count": count})
+        response = _business_user_not_found_response(business_user_id)
+        if response:
+            return response
+        counts = _cached_order_counts(
+            business_user_id, Order.STATUS_COMPLETED)
+        return Response({"completed_order_count": counts[Order.STATUS_COMPLETED]})
+
+
+class OrderStatsView(APIView):
+    """Return in-progress and completed order counts for a business user."""
+    permission_classes = [permissions.IsAuthenticated]
+
+    def get(self, request, business_user_id):
+        response = _business_user_not_found_response(business_user_id)
+        if response:
+            return response
+        counts = _cached_order_counts(
+            business_user_id, Order.STATUS_IN_PROGRESS, Order.STATUS_COMPLETED)
+        return Response({
+            "order_count": counts[Order.STATUS_IN_PROGRESS],
+            "completed_order_count": counts[Order.STATUS_COMPLETED],
+        })
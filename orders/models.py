@@ -36,5 +36,11 @@ class Order(models.Model):
     created_at = models.DateTimeField(auto_now_add=True)
     updated_at = models.DateTimeField(auto_now=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["business_user", "status"],
+                         name="order_business_status_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"Order #{self.pk} ({self.status})"
@@ -0,0 +1,17 @@
+"""Signal handlers that keep cached order counts fresh."""
+
+from django.core.cache import cache
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from orders.api.views import _order_count_cache_key
+from orders.models import Order
+
+
+@receiver([post_save, post_delete], sender=Order)
+def invalidate_order_counts(sender, instance, **kwargs):
+    """Drop cached order counts of the order's business user."""
+    cache.delete_many([
+        _order_count_cache_key(instance.business_user_id, order_status)
+        for order_status, _ in Order.STATUS_CHOICES
+    ])
@@ -1,11 +1,30 @@
-from copy import deepcopy
+import json
 
 from django.contrib.auth import get_user_model
+from django.core.cache import cache
+from django.test import SimpleTestCase
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.test import APIClient, APIRequestFactory, APITestCase
 
+from offers.models import Offer, OfferDetail
+from orders.api.views import (
+    CompletedOrderCountView,
+    OrderCountView,
+    OrderStatsView,
+    OrdersListCreateView,
+    OrdersUpdateDeleteView,
+)
+from orders.models import Order
+from profiles.models import Profile
 
-ORDER_KEYS = {
+
+User = get_user_model()
+
+
+request_factory = APIRequestFactory()
+
+
+ORDER_KEYS = frozenset({
     "id",
     "customer_user",
     "business_user",
@@ -18,10 +37,10 @@ ORDER_KEYS = {
     "status",
     "created_at",
     "updated_at",
-}
+})
 
 
-ORDER_CREATE_KEYS = {
+ORDER_CREATE_KEYS = frozenset({
     "id",
     "customer_user",
     "business_user",
@@ -33,215 +52,236 @@ ORDER_CREATE_KEYS = {
     "offer_type",
     "status",
     "created_at",
-}
+})
 
 
 OFFER_PAYLOAD = {
     "title": "Grafikdesign-Paket",
-    "image": None,
     "description": "Ein umfassendes Grafikdesign-Paket für Unternehmen.",
     "details": [
-                {
-                    "title": "Basic Design",
-                    "revisions": 2,
-                    "delivery_time_in_days": 5,
-                    "price": 100,
-                    "features": ["Logo Design", "Visitenkarte"],
-                    "offer_type": "basic",
-                },
         {
-                    "title": "Standard Design",
-                    "revisions": 5,
-                    "delivery_time_in_days": 7,
-                    "price": 200,
-                    "features": ["Logo Design", "Visitenkarte", "Briefpapier"],
-                    "offer_type": "standard",
-                },
+            "title": "Basic Design",
+            "revisions": 2,
+            "delivery_time_in_days": 5,
+            "price": 100,
+            "features": ["Logo Design", "Visitenkarte"],
+            "offer_type": "basic",
+        },
         {
-                    "title": "Premium Design",
-                    "revisions": 10,
-                    "delivery_time_in_days": 10,
-                    "price": 500,
-                    "features": ["Logo Design", "Visitenkarte", "Briefpapier", "Flyer"],
-                    "offer_type": "premium",
-                },
+            "title": "Standard Design",
+            "revisions": 5,
+            "delivery_time_in_days": 7,
+            "price": 200,
+            "features": ["Logo Design", "Visitenkarte", "Briefpapier"],
+            "offer_type": "standard",
+        },
+        {
+            "title": "Premium Design",
+            "revisions": 10,
+            "delivery_time_in_days": 10,
+            "price": 500,
+            "features": ["Logo Design", "Visitenkarte", "Briefpapier", "Flyer"],
+            "offer_type": "premium",
+        },
     ],
 }
 
 
-def _build_offer_payload():
-    return deepcopy(OFFER_PAYLOAD)
+STATUS_COMPLETED_BODY = json.dumps({"status": "completed"}).encode()
+
+
+LIST_ROW_COUNT = 5
 
 
 def _assert_order_keys(testcase, data, expected_keys):
-    for key in expected_keys:
-        testcase.assertIn(key, data)
+    testcase.assertFalse(expected_keys - data.keys(), "missing keys")
+
+
+def _authenticated_client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+def _create_user(username, email, **kwargs):
+    return User.objects.create_user(username=username, email=email, **kwargs)
+
+
+def _create_order(customer_user, business_user, order_status=Order.STATUS_IN_PROGRESS):
+    return Order.objects.create(
+        customer_user=customer_user,
+        business_user=business_user,
+        title="Basic Design",
+        revisions=2,
+        delivery_time_in_days=5,
+        price=100,
+        offer_type="basic",
+        status=order_status,
+    )
+
+
+def _create_offer_detail_id(owner):
+    offer = Offer.objects.create(
+        user=owner, title=OFFER_PAYLOAD["title"], description=OFFER_PAYLOAD["description"])
+    details = OfferDetail.objects.bulk_create(
+        [OfferDetail(offer=offer, **detail) for detail in OFFER_PAYLOAD["details"]])
+    return details[0].pk
 
 
-def _create_user(user_model, username, email, password, **kwargs):
-    return user_model.objects.create_user(username=username, email=email, password=password, **kwargs)
+class OrdersAuthenticationRequiredApiTests(SimpleTestCase):
+    def test_endpoints_require_authentication(self):
+        cases = [
+            ("get", "/api/orders/", OrdersListCreateView, {}, None),
+            ("post", "/api/orders/", OrdersListCreateView, {}, {"offer_detail_id": 1}),
+            ("patch", "/api/orders/1/", OrdersUpdateDeleteView,
+             {"pk": 1}, {"status": "completed"}),
+            ("delete", "/api/orders/1/", OrdersUpdateDeleteView, {"pk": 1}, None),
+            ("get", "/api/order-count/1/", OrderCountView, {"business_user_id": 1}, None),
+            ("get", "/api/completed-order-count/1/", CompletedOrderCountView,
+             {"business_user_id": 1}, None),
+            ("get", "/api/order-stats/1/", OrderStatsView, {"business_user_id": 1}, None),
+        ]
+        for method, url, view_class, view_kwargs, payload in cases:
+            with self.subTest(method=method, url=url):
+                request = getattr(request_factory, method)(url, payload, format="json")
+                response = view_class.as_view()(request, **view_kwargs)
+
+                self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
 class OrdersListApiTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = _create_user("orders_list_user", "orders_list_user@example.com")
+        business_user = _create_user("orders_list_business", "orders_list_business@example.com")
+        Order.objects.bulk_create([
+            Order(
+                customer_user=cls.user,
+                business_user=business_user,
+                title=f"Order {index}",
+                revisions=2,
+                delivery_time_in_days=5,
+                price=100,
+                offer_type="basic",
+            )
+            for index in range(LIST_ROW_COUNT)
+        ])
+
     def setUp(self):
-        self.user_model = get_user_model()
-        self.user = _create_user(
-            self.user_model, "orders_list_user", "orders_list_user@example.com", "testpass123")
+        self.user_client = _authenticated_client(self.user)
         self.url = "/api/orders/"
 
-    def test_get_orders_requires_authentication(self):
-        response = self.client.get(self.url)
-
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-
     def test_get_orders_success_structure(self):
-        self.client.force_authenticate(user=self.user)
-        response = self.client.get(self.url)
+        with self.assertNumQueries(1):
+            response = self.user_client.get(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         data = response.json()
         self.assertIsInstance(data, list)
+        self.assertEqual(len(data), LIST_ROW_COUNT)
 
         if data:
             _assert_order_keys(self, data[0], ORDER_KEYS)
 
 
-class OrdersCreateApiTests(APITestCase):
-    def setUp(self):
-        self.user_model = get_user_model()
-        self.customer_user = _create_user(
-            self.user_model, "customer_user", "customer_user@example.com", "testpass123")
-        self.business_user = _create_user(
-            self.user_model, "business_user", "business_user@example.com", "testpass123")
-        self.url = "/api/orders/"
-        self.offers_url = "/api/offers/"
-        self.offer_payload = _build_offer_payload()
+class _OrdersFixtureMixin:
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.customer_user = _create_user("customer_user", "customer_user@example.com")
+        cls.business_user = _create_user("business_user", "business_user@example.com")
+        cls.other_business_user = _create_user("other_business", "other_business@example.com")
+        cls.staff_user = _create_user("staff_user", "staff_user@example.com", is_staff=True)
+        cls.normal_user = _create_user("normal_user", "normal_user@example.com")
+        cls.detail_id = _create_offer_detail_id(cls.business_user)
+        cls.order = _create_order(cls.customer_user, cls.business_user)
 
-    def _create_offer_and_get_detail_id(self):
-        self.client.force_authenticate(user=self.business_user)
-        response = self.client.post(
-            self.offers_url, self.offer_payload, format="json")
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        details = response.json().get("details", [])
-        self.assertTrue(details)
-        return details[0].get("id")
+    def setUp(self):
+        super().setUp()
+        self.customer_client = _authenticated_client(self.customer_user)
+        self.business_client = _authenticated_client(self.business_user)
+        self.other_business_client = _authenticated_client(self.other_business_user)
+        self.staff_client = _authenticated_client(self.staff_user)
+        self.normal_client = _authenticated_client(self.normal_user)
 
-    def test_create_order_requires_authentication(self):
-        response = self.client.post(
-            self.url, {"offer_detail_id": 1}, format="json")
 
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+class OrdersCreateApiTests(_OrdersFixtureMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.url = "/api/orders/"
 
     def test_create_order_forbidden_for_non_customer(self):
-        self.client.force_authenticate(user=self.business_user)
-        response = self.client.post(
+        response = self.business_client.post(
             self.url, {"offer_detail_id": 1}, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_create_order_missing_offer_detail_id(self):
-        self.client.force_authenticate(user=self.customer_user)
-        response = self.client.post(self.url, {}, format="json")
+        response = self.customer_client.post(self.url, {}, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_create_order_offer_detail_id_invalid_type(self):
-        self.client.force_authenticate(user=self.customer_user)
-        response = self.client.post(
+        response = self.customer_client.post(
             self.url, {"offer_detail_id": "not-an-integer"}, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_create_order_offer_detail_not_found(self):
-        self.client.force_authenticate(user=self.customer_user)
-        response = self.client.post(
+        response = self.customer_client.post(
             self.url, {"offer_detail_id": 999999}, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_create_order_success(self):
-        detail_id = self._create_offer_and_get_detail_id()
-        self.client.force_authenticate(user=self.customer_user)
-        response = self.client.post(
-            self.url, {"offer_detail_id": detail_id}, format="json")
+        response = self.customer_client.post(
+            self.url, {"offer_detail_id": self.detail_id}, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         data = response.json()
         _assert_order_keys(self, data, ORDER_CREATE_KEYS)
+        self.assertEqual(data["business_user"], self.business_user.pk)
 
+    def test_create_order_skips_business_user_lookup(self):
+        with self.assertNumQueries(3):
+            response = self.customer_client.post(
+                self.url, {"offer_detail_id": self.detail_id}, format="json")
 
-class OrdersUpdateApiTests(APITestCase):
-    def setUp(self):
-        self.user_model = get_user_model()
-        self.customer_user = _create_user(
-            self.user_model, "customer_status", "customer_status@example.com", "testpass123")
-        self.business_user = _create_user(
-            self.user_model, "business_status", "business_status@example.com", "testpass123")
-        self.other_business_user = _create_user(
-            self.user_model, "other_business", "other_business@example.com", "testpass123")
-        self.orders_url = "/api/orders/"
-        self.offers_url = "/api/offers/"
-        self.offer_payload = _build_offer_payload()
-
-    def _create_offer_and_get_detail_id(self):
-        self.client.force_authenticate(user=self.business_user)
-        response = self.client.post(
-            self.offers_url, self.offer_payload, format="json")
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        details = response.json().get("details", [])
-        self.assertTrue(details)
-        return details[0].get("id")
-
-    def _create_order(self):
-        detail_id = self._create_offer_and_get_detail_id()
-        self.client.force_authenticate(user=self.customer_user)
-        response = self.client.post(
-            self.orders_url, {"offer_detail_id": detail_id}, format="json")
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        return response.json().get("id")
 
-    def test_patch_order_requires_authentication(self):
-        response = self.client.patch(
-            f"{self.orders_url}1/", {"status": "completed"}, format="json")
 
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+class OrdersUpdateApiTests(_OrdersFixtureMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
+        self.orders_url = "/api/orders/"
 
     def test_patch_order_not_found(self):
-        self.client.force_authenticate(user=self.business_user)
-        response = self.client.patch(
-            f"{self.orders_url}999999/", {"status": "completed"}, format="json")
+        response = self.business_client.patch(
+            f"{self.orders_url}999999/", STATUS_COMPLETED_BODY, content_type="application/json")
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_patch_order_forbidden_for_non_business(self):
-        order_id = self._create_order()
-        self.client.force_authenticate(user=self.customer_user)
-        response = self.client.patch(
-            f"{self.orders_url}{order_id}/", {"status": "completed"}, format="json")
+        response = self.customer_client.patch(
+            f"{self.orders_url}{self.order.pk}/", STATUS_COMPLETED_BODY, content_type="application/json")
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_patch_order_forbidden_for_other_business(self):
-        order_id = self._create_order()
-        self.client.force_authenticate(user=self.other_business_user)
-        response = self.client.patch(
-            f"{self.orders_url}{order_id}/", {"status": "completed"}, format="json")
+        response = self.other_business_client.patch(
+            f"{self.orders_url}{self.order.pk}/", STATUS_COMPLETED_BODY, content_type="application/json")
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_patch_order_invalid_status_returns_400(self):
-        order_id = self._create_order()
-        self.client.force_authenticate(user=self.business_user)
-        response = self.client.patch(
-            f"{self.orders_url}{order_id}/", {"status": "not_valid"}, format="json")
+        response = self.business_client.patch(
+            f"{self.orders_url}{self.order.pk}/", {"status": "not_valid"}, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_patch_order_success(self):
-        order_id = self._create_order()
-        self.client.force_authenticate(user=self.business_user)
-        response = self.client.patch(
-            f"{self.orders_url}{order_id}/", {"status": "completed"}, format="json")
+        response = self.business_client.patch(
+            f"{self.orders_url}{self.order.pk}/", STATUS_COMPLETED_BODY, content_type="application/json")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         data = response.json()
@@ -249,126 +289,129 @@ class OrdersUpdateApiTests(APITestCase):
         self.assertEqual(data["status"], "completed")
 
 
-class OrdersDeleteApiTests(APITestCase):
+class OrdersDeleteApiTests(_OrdersFixtureMixin, APITestCase):
     def setUp(self):
-        self.user_model = get_user_model()
-        self.staff_user = _create_user(
-            self.user_model,
-            "staff_user",
-            "staff_user@example.com",
-            "testpass123",
-            is_staff=True,
-        )
-        self.normal_user = _create_user(
-            self.user_model, "normal_user", "normal_user@example.com", "testpass123")
-        self.customer_user = _create_user(
-            self.user_model, "customer_delete", "customer_delete@example.com", "testpass123")
-        self.business_user = _create_user(
-            self.user_model, "business_delete", "business_delete@example.com", "testpass123")
+        super().setUp()
         self.orders_url = "/api/orders/"
-        self.offers_url = "/api/offers/"
-        self.offer_payload = _build_offer_payload()
-
-    def _create_offer_and_get_detail_id(self):
-        self.client.force_authenticate(user=self.business_user)
-        response = self.client.post(
-            self.offers_url, self.offer_payload, format="json")
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        details = response.json().get("details", [])
-        self.assertTrue(details)
-        return details[0].get("id")
-
-    def _create_order(self):
-        detail_id = self._create_offer_and_get_detail_id()
-        self.client.force_authenticate(user=self.customer_user)
-        response = self.client.post(
-            self.orders_url, {"offer_detail_id": detail_id}, format="json")
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        return response.json().get("id")
-
-    def test_delete_order_requires_authentication(self):
-        response = self.client.delete(f"{self.orders_url}1/")
-
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
     def test_delete_order_forbidden_for_non_staff(self):
-        order_id = self._create_order()
-        self.client.force_authenticate(user=self.normal_user)
-
-        response = self.client.delete(f"{self.orders_url}{order_id}/")
+        response = self.normal_client.delete(f"{self.orders_url}{self.order.pk}/")
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_delete_order_not_found(self):
-        self.client.force_authenticate(user=self.staff_user)
-
-        response = self.client.delete(f"{self.orders_url}999999/")
+        response = self.staff_client.delete(f"{self.orders_url}999999/")
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_delete_order_success_returns_204_no_content(self):
-        order_id = self._create_order()
-        self.client.force_authenticate(user=self.staff_user)
-
-        response = self.client.delete(f"{self.orders_url}{order_id}/")
+        response = self.staff_client.delete(f"{self.orders_url}{self.order.pk}/")
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertEqual(response.content, b"")
 
 
 class OrdersCountApiTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.business_user = _create_user("count_business", "count_business@example.com")
+
     def setUp(self):
-        self.user_model = get_user_model()
-        self.business_user = _create_user(
-            self.user_model, "count_business", "count_business@example.com", "testpass123")
+        self.business_client = _authenticated_client(self.business_user)
         self.url_base = "/api/order-count/"
-
-    def test_get_order_count_requires_authentication(self):
-        response = self.client.get(f"{self.url_base}{self.business_user.pk}/")
-
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        cache.clear()
 
     def test_get_order_count_not_found(self):
-        self.client.force_authenticate(user=self.business_user)
-        response = self.client.get(f"{self.url_base}999999/")
+        response = self.business_client.get(f"{self.url_base}999999/")
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_get_order_count_success_response(self):
-        self.client.force_authenticate(user=self.business_user)
-        response = self.client.get(f"{self.url_base}{self.business_user.pk}/")
+        response = self.business_client.get(f"{self.url_base}{self.business_user.pk}/")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         data = response.json()
         self.assertIn("order_count", data)
 
+    def test_get_order_count_uses_two_queries(self):
+        Profile.objects.create(user=self.business_user,
+                               type=Profile.TYPE_BUSINESS)
+
+        with self.assertNumQueries(2):
+            response = self.business_client.get(
+                f"{self.url_base}{self.business_user.pk}/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
 
 class CompletedOrdersCountApiTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.business_user = _create_user("completed_business", "completed_business@example.com")
+
     def setUp(self):
-        self.user_model = get_user_model()
-        self.business_user = _create_user(
-            self.user_model,
-            "completed_business",
-            "completed_business@example.com",
-            "testpass123",
-        )
+        self.business_client = _authenticated_client(self.business_user)
         self.url_base = "/api/completed-order-count/"
-
-    def test_get_completed_order_count_requires_authentication(self):
-        response = self.client.get(f"{self.url_base}{self.business_user.pk}/")
-
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        cache.clear()
 
     def test_get_completed_order_count_not_found(self):
-        self.client.force_authenticate(user=self.business_user)
-        response = self.client.get(f"{self.url_base}999999/")
+        response = self.business_client.get(f"{self.url_base}999999/")
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_get_completed_order_count_success_response(self):
-        self.client.force_authenticate(user=self.business_user)
-        response = self.client.get(f"{self.url_base}{self.business_user.pk}/")
+        response = self.business_client.get(f"{self.url_base}{self.business_user.pk}/")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         data = response.json()
         self.assertIn("completed_order_count", data)
+
+
+class OrderStatsApiTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.business_user = _create_user("stats_business", "stats_business@example.com")
+        cls.customer_user = _create_user("stats_customer", "stats_customer@example.com")
+
+    def setUp(self):
+        self.business_client = _authenticated_client(self.business_user)
+        self.url_base = "/api/order-stats/"
+        cache.clear()
+
+    def test_get_order_stats_not_found(self):
+        response = self.business_client.get(f"{self.url_base}999999/")
+
+        self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
+
+    def test_get_order_stats_success_response(self):
+        _create_order(self.customer_user, self.business_user, Order.STATUS_IN_PROGRESS)
+        _create_order(self.customer_user, self.business_user, Order.STATUS_IN_PROGRESS)
+        _create_order(self.customer_user, self.business_user, Order.STATUS_COMPLETED)
+
+        response = self.business_client.get(f"{self.url_base}{self.business_user.pk}/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json(), {
+                         "order_count": 2, "completed_order_count": 1})
+
+    def test_get_order_stats_served_from_cache(self):
+        Profile.objects.create(user=self.business_user,
+                               type=Profile.TYPE_BUSINESS)
+        self.business_client.get(f"{self.url_base}{self.business_user.pk}/")
+
+        with self.assertNumQueries(1):
+            response = self.business_client.get(
+                f"{self.url_base}{self.business_user.pk}/")
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+
+    def test_get_order_stats_refreshed_after_status_change(self):
+        order = _create_order(self.customer_user, self.business_user, Order.STATUS_IN_PROGRESS)
+        self.business_client.get(f"{self.url_base}{self.business_user.pk}/")
+        order.status = Order.STATUS_COMPLETED
+        order.save()
+
+        response = self.business_client.get(f"{self.url_base}{self.business_user.pk}/")
+
+        self.assertEqual(response.json(), {
+                         "order_count": 0, "completed_order_count": 1})
@@ -4,26 +4,53 @@ from rest_framework import serializers
 
 from profiles.models import Profile
 
+BLANK_WHEN_NULL_FIELDS = (
+    "first_name",
+    "last_name",
+    "location",
+    "tel",
+    "description",
+    "working_hours",
+)
 
-def _normalize_nulls(data, keys):
+
+def _normalize_nulls(data, keys=BLANK_WHEN_NULL_FIELDS):
     """Replace null values with empty strings for selected keys."""
     for key in keys:
-        if data.get(key) is None:
+        if data[key] is None:
             data[key] = ""
     return data
 
 
+def _profile_list_representation(instance):
+    """Build a profile list item straight from the loaded model instances."""
+    user = instance.user
+    return {
+        "user": instance.user_id,
+        "username": user.username,
+        "first_name": user.first_name or "",
+        "last_name": user.last_name or "",
+        "file": instance.file.url if instance.file else None,
+        "location": instance.location or "",
+        "tel": instance.tel or "",
+        "description": instance.description or "",
+        "working_hours": instance.working_hours or "",
+        "type": instance.type,
+    }
+
+
 def _update_user_fields(user, user_data, fields):
     """Update user fields from nested payload data."""
-    for field in fields:
-        if field in user_data:
-            setattr(user, field, user_data[field])
-    user.save()
+    changed = [field for field in fields if field in user_data]
+    for field in changed:
+        setattr(user, field, user_data[field])
+    if changed:
+        user.save(update_fields=changed)
 
 
 class ProfileSerializer(serializers.ModelSerializer):
     """Serializer for full profile details."""
-    user = serializers.IntegerField(source="user.id", read_only=True)
+    user = serializers.IntegerField(source="user_id", read_only=True)
     username = serializers.CharField(source="user.username", read_only=True)
     first_name = serializers.CharField(
         source="user.first_name", allow_blank=True, required=False)
@@ -50,10 +77,7 @@ class ProfileSerializer(serializers.ModelSerializer):
         read_only_fields = ["created_at", "user", "username"]
 
     def to_representation(self, instance):
-        data = super().to_representation(instance)
-        keys = ["first_name", "last_name", "location",
-                "tel", "description", "working_hours"]
-        return _normalize_nulls(data, keys)
+        return _normalize_nulls(super().to_representation(instance))
 
     def update(self, instance, validated_data):
         user_data = validated_data.pop("user", {})
@@ -64,7 +88,7 @@ class ProfileSerializer(serializers.ModelSerializer):
 
 class BusinessProfileListSerializer(serializers.ModelSerializer):
     """Serializer for listing business profiles."""
-    user = serializers.IntegerField(source="user.id", read_only=True)
+    user = serializers.IntegerField(source="user_id", read_only=True)
     username = serializers.CharField(source="user.username", read_only=True)
     first_name = serializers.CharField(
         source="user.first_name", allow_blank=True, required=False)
@@ -87,15 +111,12 @@ class BusinessProfileListSerializer(serializers.ModelSerializer):
         ]
 
     def to_representation(self, instance):
-        data = super().to_representation(instance)
-        keys = ["first_name", "last_name", "location",
-                "tel", "description", "working_hours"]
-        return _normalize_nulls(data, keys)
+        return _profile_list_representation(instance)
 
 
 class CustomerProfileListSerializer(serializers.ModelSerializer):
     """Serializer for listing customer profiles."""
-    user = serializers.IntegerField(source="user.id", read_only=True)
+    user = serializers.IntegerField(source="user_id", read_only=True)
     username = serializers.CharField(source="user.username", read_only=True)
     first_name = serializers.CharField(
         source="user.first_name", allow_blank=True, required=False)
@@ -118,7 +139,4 @@ class CustomerProfileListSerializer(serializers.ModelSerializer):
         ]
 
     def to_representation(self, instance):
-        data = super().to_representation(instance)
-        keys = ["first_name", "last_name", "location",
-            "tel", "description", "working_hours"]
-        return _normalize_nulls(data, keys)
+        return _profile_list_representation(instance)
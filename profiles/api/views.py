@@ -7,7 +7,11 @@ from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from common.permissions import IsProfileOwner
-from common.utils import _get_or_create_profile
+from common.utils import (
+    _get_or_create_profile,
+    _get_profile_or_unsaved,
+    _optionally_paginated_response,
+)
 from profiles.models import Profile
 from profiles.api.serializers import (
     BusinessProfileListSerializer,
@@ -17,6 +21,27 @@ from profiles.api.serializers import (
 
 User = get_user_model()
 
+PROFILE_LIST_FIELDS = [
+    "id",
+    "user",
+    "type",
+    "file",
+    "location",
+    "tel",
+    "description",
+    "working_hours",
+    "user__id",
+    "user__username",
+    "user__first_name",
+    "user__last_name",
+]
+
+
+def _profiles_by_type(profile_type):
+    """Return profiles of a type with only the listed columns loaded."""
+    queryset = Profile.objects.filter(type=profile_type).select_related("user")
+    return queryset.only(*PROFILE_LIST_FIELDS)
+
 
 class ProfileDetailView(APIView):
     """Retrieve and update profile details."""
@@ -28,13 +53,12 @@ class ProfileDetailView(APIView):
         return [permissions.IsAuthenticated()]
 
     def get(self, request, pk):
-        user = get_object_or_404(User, pk=pk)
-        profile = _get_or_create_profile(user)
-        serializer = ProfileSerializer(profile)
+        user = get_object_or_404(User.objects.select_related("profile"), pk=pk)
+        serializer = ProfileSerializer(_get_profile_or_unsaved(user))
         return Response(serializer.data)
 
     def patch(self, request, pk):
-        user = get_object_or_404(User, pk=pk)
+        user = get_object_or_404(User.objects.select_related("profile"), pk=pk)
         profile = _get_or_create_profile(user)
         self.check_object_permissions(request, profile)
         serializer = ProfileSerializer(
@@ -49,9 +73,9 @@ class BusinessProfilesListView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
-        profiles = Profile.objects.filter(type=Profile.TYPE_BUSINESS)
-        serializer = BusinessProfileListSerializer(profiles, many=True)
-        return Response(serializer.data)
+        profiles = _profiles_by_type(Profile.TYPE_BUSINESS)
+        return _optionally_paginated_response(
+            request, profiles, BusinessProfileListSerializer)
 
 
 class CustomerProfilesListView(APIView):
@@ -59,6 +83,6 @@ class CustomerProfilesListView(APIView):
     permission_classes = [permissions.IsAuthenticated]
 
     def get(self, request):
-        profiles = Profile.objects.filter(type=Profile.TYPE_CUSTOMER)
-        serializer = CustomerProfileListSerializer(profiles, many=True)
-        return Response(serializer.data)
+        profiles = _profiles_by_type(Profile.TYPE_CUSTOMER)
+        return _optionally_paginated_response(
+            request, profiles, CustomerProfileListSerializer)
@@ -23,5 +23,10 @@ class Profile(models.Model):
     type = models.CharField(max_length=20, choices=TYPE_CHOICES)
     created_at = models.DateTimeField(auto_now_add=True)
 
+    class Meta:
+        indexes = [
+            models.Index(fields=["type"], name="profile_type_idx"),
+        ]
+
     def __str__(self) -> str:
         return f"{self.user.username} ({self.type})"
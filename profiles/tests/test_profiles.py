@@ -1,9 +1,25 @@
 from django.contrib.auth import get_user_model
+from django.db import connection
+from django.test import SimpleTestCase
+from django.test.utils import CaptureQueriesContext
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.test import APIClient, APIRequestFactory, APITestCase
 
+from profiles.api.views import (
+    BusinessProfilesListView,
+    CustomerProfilesListView,
+    ProfileDetailView,
+)
+from profiles.models import Profile
 
-PROFILE_DETAIL_KEYS = {
+
+User = get_user_model()
+
+
+request_factory = APIRequestFactory()
+
+
+PROFILE_DETAIL_KEYS = frozenset({
     "user",
     "username",
     "first_name",
@@ -16,10 +32,10 @@ PROFILE_DETAIL_KEYS = {
     "type",
     "email",
     "created_at",
-}
+})
 
 
-BUSINESS_PROFILE_KEYS = {
+BUSINESS_PROFILE_KEYS = frozenset({
     "user",
     "username",
     "first_name",
@@ -30,22 +46,31 @@ BUSINESS_PROFILE_KEYS = {
     "description",
     "working_hours",
     "type",
-}
+})
 
 
-CUSTOMER_PROFILE_KEYS = {
+CUSTOMER_PROFILE_KEYS = frozenset({
     "user",
     "username",
     "first_name",
     "last_name",
     "file",
     "type",
-}
+})
+
+
+LIST_ROW_COUNT = 5
+
+
+def _create_profiles(profile_type, count=LIST_ROW_COUNT):
+    for index in range(count):
+        user = User.objects.create_user(
+            username=f"{profile_type}_seed{index}", email=f"{profile_type}_seed{index}@example.com")
+        Profile.objects.create(user=user, type=profile_type)
 
 
 def _assert_keys(testcase, data, expected_keys):
-    for key in expected_keys:
-        testcase.assertIn(key, data)
+    testcase.assertFalse(expected_keys - data.keys(), "missing keys")
 
 
 def _assert_non_null_strings(testcase, data, keys):
@@ -54,50 +79,63 @@ def _assert_non_null_strings(testcase, data, keys):
         testcase.assertIsInstance(data[key], str)
 
 
-def _create_user(user_model, username, email, password, **kwargs):
-    return user_model.objects.create_user(username=username, email=email, password=password, **kwargs)
+def _authenticated_client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
+
+def _create_user(username, email, **kwargs):
+    return User.objects.create_user(username=username, email=email, **kwargs)
+
+
+class ProfilesAuthenticationRequiredApiTests(SimpleTestCase):
+    def test_endpoints_require_authentication(self):
+        cases = [
+            ("get", "/api/profile/1/", ProfileDetailView, {"pk": 1}, None),
+            ("patch", "/api/profile/1/", ProfileDetailView, {"pk": 1}, {"first_name": "Max"}),
+            ("get", "/api/profiles/business/", BusinessProfilesListView, {}, None),
+            ("get", "/api/profiles/customer/", CustomerProfilesListView, {}, None),
+        ]
+        for method, url, view_class, view_kwargs, payload in cases:
+            with self.subTest(method=method, url=url):
+                request = getattr(request_factory, method)(url, payload, format="json")
+                response = view_class.as_view()(request, **view_kwargs)
+
+                self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
 class ProfileDetailApiTests(APITestCase):
-    def setUp(self):
-        self.user_model = get_user_model()
-        self.user = _create_user(
-            self.user_model,
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = _create_user(
             "max_mustermann",
             "max@business.de",
-            "testpass123",
             first_name="Max",
             last_name="Mustermann",
         )
-        self.other_user = _create_user(
-            self.user_model, "other_user", "other@business.de", "testpass123")
-        self.business_user = _create_user(
-            self.user_model,
+        cls.other_user = _create_user("other_user", "other@business.de")
+        cls.business_user = _create_user(
             "business_max",
             "new_email@business.de",
-            "testpass123",
             first_name="Max",
             last_name="Mustermann",
         )
+
+    def setUp(self):
+        self.user_client = _authenticated_client(self.user)
+        self.business_client = _authenticated_client(self.business_user)
+        self.other_client = _authenticated_client(self.other_user)
         self.url = f"/api/profile/{self.user.pk}/"
         self.business_url = f"/api/profile/{self.business_user.pk}/"
 
-    def test_get_profile_requires_authentication(self):
-        response = self.client.get(self.url)
-
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-
     def test_get_profile_not_found(self):
-        self.client.force_authenticate(user=self.user)
-
-        response = self.client.get("/api/profile/999999/")
+        response = self.user_client.get("/api/profile/999999/")
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_get_profile_success_fields_and_non_null_strings(self):
-        self.client.force_authenticate(user=self.user)
-
-        response = self.client.get(self.url)
+        response = self.user_client.get(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         data = response.json()
@@ -109,9 +147,24 @@ class ProfileDetailApiTests(APITestCase):
                 "tel", "description", "working_hours"],
         )
 
-    def test_patch_profile_updates_fields(self):
-        self.client.force_authenticate(user=self.user)
+    def test_get_profile_without_profile_row_does_not_write(self):
+        with self.assertNumQueries(1):
+            response = self.user_client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["type"], Profile.TYPE_BUSINESS)
+        self.assertFalse(Profile.objects.filter(user=self.user).exists())
+
+    def test_get_profile_loads_user_and_profile_in_one_query(self):
+        Profile.objects.create(user=self.user, type=Profile.TYPE_BUSINESS)
+
+        with self.assertNumQueries(1):
+            response = self.user_client.get(self.url)
 
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.json()["username"], "max_mustermann")
+
+    def test_patch_profile_updates_fields(self):
         payload = {
             "first_name": "Maximilian",
             "last_name": "Mustermann",
@@ -122,7 +175,7 @@ class ProfileDetailApiTests(APITestCase):
             "email": "new_email@business.de",
         }
 
-        response = self.client.patch(self.url, payload, format="json")
+        response = self.user_client.patch(self.url, payload, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         data = response.json()
@@ -136,8 +189,6 @@ class ProfileDetailApiTests(APITestCase):
         )
 
     def test_patch_business_profile_updates_fields_and_non_null_strings(self):
-        self.client.force_authenticate(user=self.business_user)
-
         payload = {
             "first_name": "Max",
             "last_name": "Mustermann",
@@ -148,7 +199,7 @@ class ProfileDetailApiTests(APITestCase):
             "email": "new_email@business.de",
         }
 
-        response = self.client.patch(self.business_url, payload, format="json")
+        response = self.business_client.patch(self.business_url, payload, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         data = response.json()
@@ -162,71 +213,66 @@ class ProfileDetailApiTests(APITestCase):
                 "tel", "description", "working_hours"],
         )
 
-    def test_patch_profile_requires_authentication(self):
-        payload = {
-            "first_name": "Max",
-        }
+    def test_patch_profile_writes_only_changed_user_columns(self):
+        with CaptureQueriesContext(connection) as queries:
+            response = self.user_client.patch(
+                self.url, {"first_name": "Maximilian"}, format="json")
 
-        response = self.client.patch(self.url, payload, format="json")
-
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        user_updates = [query["sql"] for query in queries.captured_queries
+                        if query["sql"].startswith('UPDATE "auth_user"')]
+        self.assertEqual(len(user_updates), 1)
+        self.assertNotIn("password", user_updates[0])
 
     def test_patch_profile_forbidden_if_not_owner(self):
-        self.client.force_authenticate(user=self.other_user)
         payload = {
             "first_name": "NotAllowed",
         }
 
-        response = self.client.patch(self.url, payload, format="json")
+        response = self.other_client.patch(self.url, payload, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_patch_profile_not_found(self):
-        self.client.force_authenticate(user=self.user)
         payload = {
             "first_name": "Max",
         }
 
-        response = self.client.patch(
+        response = self.user_client.patch(
             "/api/profile/999999/", payload, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
 
 class BusinessProfilesListApiTests(APITestCase):
-    def setUp(self):
-        self.user_model = get_user_model()
-        self.business_user = _create_user(
-            self.user_model,
+    @classmethod
+    def setUpTestData(cls):
+        cls.business_user = _create_user(
             "max_business",
             "max_business@example.com",
-            "testpass123",
             first_name="Max",
             last_name="Mustermann",
         )
-        self.customer_user = _create_user(
-            self.user_model,
+        cls.customer_user = _create_user(
             "max_customer",
             "max_customer@example.com",
-            "testpass123",
             first_name="Max",
             last_name="Mustermann",
         )
-        self.url = "/api/profiles/business/"
-
-    def test_get_business_profiles_requires_authentication(self):
-        response = self.client.get(self.url)
+        _create_profiles(Profile.TYPE_BUSINESS)
 
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+    def setUp(self):
+        self.business_client = _authenticated_client(self.business_user)
+        self.url = "/api/profiles/business/"
 
     def test_get_business_profiles_success_fields_and_non_null_strings(self):
-        self.client.force_authenticate(user=self.business_user)
-
-        response = self.client.get(self.url)
+        with self.assertNumQueries(1):
+            response = self.business_client.get(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         data = response.json()
         self.assertIsInstance(data, list)
+        self.assertEqual(len(data), LIST_ROW_COUNT)
 
         if data:
             first_item = data[0]
@@ -238,41 +284,49 @@ class BusinessProfilesListApiTests(APITestCase):
                     "tel", "description", "working_hours"],
             )
 
+    def test_get_business_profiles_includes_user_fields(self):
+        Profile.objects.create(user=self.business_user,
+                               type=Profile.TYPE_BUSINESS, location="Berlin")
+
+        response = self.business_client.get(self.url)
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        item = next(item for item in response.json()
+                    if item["user"] == self.business_user.pk)
+        self.assertEqual(item["username"], "max_business")
+        self.assertEqual(item["first_name"], "Max")
+        self.assertEqual(item["location"], "Berlin")
+
 
 class CustomerProfilesListApiTests(APITestCase):
-    def setUp(self):
-        self.user_model = get_user_model()
-        self.customer_user = _create_user(
-            self.user_model,
+    @classmethod
+    def setUpTestData(cls):
+        cls.customer_user = _create_user(
             "customer_jane",
             "customer_jane@example.com",
-            "testpass123",
             first_name="Jane",
             last_name="Doe",
         )
-        self.business_user = _create_user(
-            self.user_model,
+        cls.business_user = _create_user(
             "biz_max",
             "biz_max@example.com",
-            "testpass123",
             first_name="Max",
             last_name="Mustermann",
         )
-        self.url = "/api/profiles/customer/"
-
-    def test_get_customer_profiles_requires_authentication(self):
-        response = self.client.get(self.url)
+        _create_profiles(Profile.TYPE_CUSTOMER)
 
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
+    def setUp(self):
+        self.customer_client = _authenticated_client(self.customer_user)
+        self.url = "/api/profiles/customer/"
 
     def test_get_customer_profiles_success_fields_and_non_null_strings(self):
-        self.client.force_authenticate(user=self.customer_user)
-
-        response = self.client.get(self.url)
+        with self.assertNumQueries(1):
+            response = self.customer_client.get(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         data = response.json()
         self.assertIsInstance(data, list)
+        self.assertEqual(len(data), LIST_ROW_COUNT)
 
         if data:
             first_item = data[0]
@@ -1,12 +1,17 @@
 """Review views."""
 
+from django.db import IntegrityError, transaction
 from django.shortcuts import get_object_or_404
 from rest_framework import permissions, status
 from rest_framework.response import Response
 from rest_framework.views import APIView
 
 from common.permissions import IsCustomerUser, IsReviewOwner
-from common.utils import _apply_ordering, _get_ordering_param
+from common.utils import (
+    _apply_ordering,
+    _get_ordering_param,
+    _optionally_paginated_response,
+)
 from reviews.models import Review
 from reviews.api.serializers import ReviewCreateSerializer, ReviewSerializer, ReviewUpdateSerializer
 
@@ -75,7 +80,7 @@ class ReviewsListCreateView(APIView):
             return response
         queryset = _apply_reviews_filters(Review.objects.all(), request)
         queryset = _apply_ordering(queryset, ordering)
-        return Response(ReviewSerializer(queryset, many=True).data)
+        return _optionally_paginated_response(request, queryset, ReviewSerializer)
 
     def post(self, request):
         if not IsCustomerUser().has_permission(request, self):
@@ -86,13 +91,14 @@ class ReviewsListCreateView(APIView):
         serializer = ReviewCreateSerializer(
             data=request.data, context={"request": request})
         serializer.is_valid(raise_exception=True)
-        business_user_id = serializer.validated_data["business_user"].id
-        if Review.objects.filter(business_user_id=business_user_id, reviewer=request.user).exists():
+        try:
+            with transaction.atomic():
+                review = serializer.save()
+        except IntegrityError:
             return Response(
                 {"detail": "You have already reviewed this business."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
-        review = serializer.save()
         return Response(ReviewSerializer(review).data, status=status.HTTP_201_CREATED)
 
 
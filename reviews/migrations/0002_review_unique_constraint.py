@@ -0,0 +1,23 @@
+# Generated by Django 6.0.1 on 2026-10-16 09:12
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('reviews', '0001_initial'),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddConstraint(
+            model_name='review',
+            constraint=models.UniqueConstraint(fields=('business_user', 'reviewer'), name='uniq_review_per_business_per_reviewer'),
+        ),
+        migrations.AlterUniqueTogether(
+            name='review',
+            unique_together=set(),
+        ),
+    ]
@@ -22,7 +22,16 @@ class Review(models.Model):
     updated_at = models.DateTimeField(auto_now=True)
 
     class Meta:
-        unique_together = ("business_user", "reviewer")
+        constraints = [
+            models.UniqueConstraint(fields=["business_user", "reviewer"],
+                                    name="uniq_review_per_business_per_reviewer"),
+        ]
+        indexes = [
+            models.Index(fields=["updated_at", "id"],
+                         name="review_updated_id_idx"),
+            models.Index(fields=["business_user", "rating", "id"],
+                         name="review_business_rating_idx"),
+        ]
 
     def __str__(self) -> str:
         return f"Review {self.rating}/5 by {self.reviewer}"
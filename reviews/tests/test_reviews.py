@@ -1,9 +1,19 @@
 from django.contrib.auth import get_user_model
+from django.test import SimpleTestCase
 from rest_framework import status
-from rest_framework.test import APITestCase
+from rest_framework.test import APIClient, APIRequestFactory, APITestCase
 
+from reviews.api.views import ReviewsListCreateView, ReviewsUpdateDeleteView
+from reviews.models import Review
 
-REVIEW_KEYS = {
+
+User = get_user_model()
+
+
+request_factory = APIRequestFactory()
+
+
+REVIEW_KEYS = frozenset({
     "id",
     "business_user",
     "reviewer",
@@ -11,69 +21,127 @@ REVIEW_KEYS = {
     "description",
     "created_at",
     "updated_at",
-}
+})
+
+
+PAGINATION_KEYS = frozenset({"count", "next", "previous", "results"})
+
+
+LIST_ROW_COUNT = 5
 
 
 def _assert_review_keys(testcase, data):
-    for key in REVIEW_KEYS:
-        testcase.assertIn(key, data)
+    testcase.assertFalse(REVIEW_KEYS - data.keys(), "missing keys")
+
+
+def _authenticated_client(user):
+    client = APIClient()
+    client.force_authenticate(user=user)
+    return client
+
 
+def _create_user(username, email, **kwargs):
+    return User.objects.create_user(username=username, email=email, **kwargs)
 
-def _create_user(user_model, username, email, password, **kwargs):
-    return user_model.objects.create_user(username=username, email=email, password=password, **kwargs)
+
+def _create_review(reviewer, business_user):
+    return Review.objects.create(
+        business_user=business_user,
+        reviewer=reviewer,
+        rating=4,
+        description="Alles war toll!",
+    )
+
+
+class ReviewsAuthenticationRequiredApiTests(SimpleTestCase):
+    def test_endpoints_require_authentication(self):
+        cases = [
+            ("get", "/api/reviews/", ReviewsListCreateView, {}, None),
+            ("post", "/api/reviews/", ReviewsListCreateView,
+             {}, {"business_user": 1, "rating": 4, "description": "Gut"}),
+            ("patch", "/api/reviews/1/", ReviewsUpdateDeleteView, {"pk": 1}, {"rating": 5}),
+            ("delete", "/api/reviews/1/", ReviewsUpdateDeleteView, {"pk": 1}, None),
+        ]
+        for method, url, view_class, view_kwargs, payload in cases:
+            with self.subTest(method=method, url=url):
+                request = getattr(request_factory, method)(url, payload, format="json")
+                response = view_class.as_view()(request, **view_kwargs)
+
+                self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
 
 class ReviewsListApiTests(APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.user = _create_user("reviews_list_user", "reviews_list_user@example.com")
+        Review.objects.bulk_create([
+            Review(
+                business_user=cls.user,
+                reviewer=_create_user(
+                    f"list_reviewer{index}", f"list_reviewer{index}@example.com"),
+                rating=4,
+                description="Alles war toll!",
+            )
+            for index in range(LIST_ROW_COUNT)
+        ])
+
     def setUp(self):
-        self.user_model = get_user_model()
-        self.user = _create_user(
-            self.user_model, "reviews_list_user", "reviews_list_user@example.com", "testpass123")
+        self.user_client = _authenticated_client(self.user)
         self.url = "/api/reviews/"
 
-    def test_get_reviews_requires_authentication(self):
-        response = self.client.get(self.url)
-
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-
     def test_get_reviews_success_structure(self):
-        self.client.force_authenticate(user=self.user)
-        response = self.client.get(self.url)
+        with self.assertNumQueries(1):
+            response = self.user_client.get(self.url)
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         data = response.json()
         self.assertIsInstance(data, list)
+        self.assertEqual(len(data), LIST_ROW_COUNT)
 
         if data:
             _assert_review_keys(self, data[0])
 
+    def test_get_reviews_paginated_when_page_size_given(self):
+        response = self.user_client.get(self.url, {"page_size": 2})
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        data = response.json()
+        self.assertFalse(PAGINATION_KEYS - data.keys(), "missing keys")
+
     def test_get_reviews_invalid_ordering_returns_400(self):
-        self.client.force_authenticate(user=self.user)
-        response = self.client.get(self.url, {"ordering": "invalid"})
+        response = self.user_client.get(self.url, {"ordering": "invalid"})
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_get_reviews_invalid_business_user_id_returns_400(self):
-        self.client.force_authenticate(user=self.user)
-        response = self.client.get(self.url, {"business_user_id": "invalid"})
+        response = self.user_client.get(self.url, {"business_user_id": "invalid"})
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_get_reviews_invalid_reviewer_id_returns_400(self):
-        self.client.force_authenticate(user=self.user)
-        response = self.client.get(self.url, {"reviewer_id": "invalid"})
+        response = self.user_client.get(self.url, {"reviewer_id": "invalid"})
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
 
-class ReviewsCreateApiTests(APITestCase):
+class _ReviewsFixtureMixin:
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.reviewer = _create_user("reviewer", "reviewer@example.com")
+        cls.business_user = _create_user("review_business", "review_business@example.com")
+        cls.other_user = _create_user("review_other", "review_other@example.com")
+
     def setUp(self):
-        self.user_model = get_user_model()
-        self.customer_user = _create_user(
-            self.user_model, "review_customer", "review_customer@example.com", "testpass123")
-        self.business_user = _create_user(
-            self.user_model, "review_business", "review_business@example.com", "testpass123")
-        self.other_customer = _create_user(
-            self.user_model, "review_customer2", "review_customer2@example.com", "testpass123")
+        super().setUp()
+        self.reviewer_client = _authenticated_client(self.reviewer)
+        self.business_client = _authenticated_client(self.business_user)
+        self.other_client = _authenticated_client(self.other_user)
+
+
+class ReviewsCreateApiTests(_ReviewsFixtureMixin, APITestCase):
+    def setUp(self):
+        super().setUp()
         self.url = "/api/reviews/"
         self.payload = {
             "business_user": self.business_user.pk,
@@ -81,20 +149,13 @@ class ReviewsCreateApiTests(APITestCase):
             "description": "Alles war toll!",
         }
 
-    def test_create_review_requires_authentication(self):
-        response = self.client.post(self.url, self.payload, format="json")
-
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-
     def test_create_review_forbidden_for_non_customer(self):
-        self.client.force_authenticate(user=self.business_user)
-        response = self.client.post(self.url, self.payload, format="json")
+        response = self.business_client.post(self.url, self.payload, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_create_review_success(self):
-        self.client.force_authenticate(user=self.customer_user)
-        response = self.client.post(self.url, self.payload, format="json")
+        response = self.reviewer_client.post(self.url, self.payload, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_201_CREATED)
         data = response.json()
@@ -102,77 +163,51 @@ class ReviewsCreateApiTests(APITestCase):
         self.assertEqual(data["business_user"], self.business_user.pk)
         self.assertEqual(data["rating"], 4)
 
-    def test_create_review_duplicate_for_business_forbidden(self):
-        self.client.force_authenticate(user=self.customer_user)
-        first = self.client.post(self.url, self.payload, format="json")
+    def test_create_review_duplicate_for_business_returns_400(self):
+        first = self.reviewer_client.post(self.url, self.payload, format="json")
         self.assertEqual(first.status_code, status.HTTP_201_CREATED)
 
-        second = self.client.post(self.url, self.payload, format="json")
-        self.assertIn(second.status_code, [
-                      status.HTTP_400_BAD_REQUEST, status.HTTP_403_FORBIDDEN])
+        second = self.reviewer_client.post(self.url, self.payload, format="json")
+        self.assertEqual(second.status_code, status.HTTP_400_BAD_REQUEST)
+        self.assertEqual(
+            second.json(), {"detail": "You have already reviewed this business."})
+
 
+class ReviewsUpdateApiTests(_ReviewsFixtureMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.review = _create_review(cls.reviewer, cls.business_user)
 
-class ReviewsUpdateApiTests(APITestCase):
     def setUp(self):
-        self.user_model = get_user_model()
-        self.reviewer = _create_user(
-            self.user_model, "review_owner", "review_owner@example.com", "testpass123")
-        self.other_user = _create_user(
-            self.user_model, "review_other", "review_other@example.com", "testpass123")
-        self.business_user = _create_user(
-            self.user_model, "review_target", "review_target@example.com", "testpass123")
+        super().setUp()
         self.url_base = "/api/reviews/"
-        self.create_payload = {
-            "business_user": self.business_user.pk,
-            "rating": 4,
-            "description": "Alles war toll!",
-        }
         self.update_payload = {
             "rating": 5,
             "description": "Noch besser als erwartet!",
         }
 
-    def _create_review(self):
-        self.client.force_authenticate(user=self.reviewer)
-        response = self.client.post(
-            self.url_base, self.create_payload, format="json")
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        return response.json().get("id")
-
-    def test_patch_review_requires_authentication(self):
-        response = self.client.patch(
-            f"{self.url_base}1/", self.update_payload, format="json")
-
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
-
     def test_patch_review_not_found(self):
-        self.client.force_authenticate(user=self.reviewer)
-        response = self.client.patch(
+        response = self.reviewer_client.patch(
             f"{self.url_base}999999/", self.update_payload, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_patch_review_forbidden_for_non_owner(self):
-        review_id = self._create_review()
-        self.client.force_authenticate(user=self.other_user)
-        response = self.client.patch(
-            f"{self.url_base}{review_id}/", self.update_payload, format="json")
+        response = self.other_client.patch(
+            f"{self.url_base}{self.review.pk}/", self.update_payload, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_patch_review_invalid_data_returns_400(self):
-        review_id = self._create_review()
-        self.client.force_authenticate(user=self.reviewer)
-        response = self.client.patch(
-            f"{self.url_base}{review_id}/", {"rating": 999}, format="json")
+        response = self.reviewer_client.patch(
+            f"{self.url_base}{self.review.pk}/", {"rating": 999}, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_400_BAD_REQUEST)
 
     def test_patch_review_success(self):
-        review_id = self._create_review()
-        self.client.force_authenticate(user=self.reviewer)
-        response = self.client.patch(
-            f"{self.url_base}{review_id}/", self.update_payload, format="json")
+        response = self.reviewer_client.patch(
+            f"{self.url_base}{self.review.pk}/", self.update_payload, format="json")
 
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         data = response.json()
@@ -181,51 +216,28 @@ class ReviewsUpdateApiTests(APITestCase):
         self.assertEqual(data["description"], "Noch besser als erwartet!")
 
 
-class ReviewsDeleteApiTests(APITestCase):
+class ReviewsDeleteApiTests(_ReviewsFixtureMixin, APITestCase):
+    @classmethod
+    def setUpTestData(cls):
+        super().setUpTestData()
+        cls.review = _create_review(cls.reviewer, cls.business_user)
+
     def setUp(self):
-        self.user_model = get_user_model()
-        self.reviewer = _create_user(
-            self.user_model, "delete_reviewer", "delete_reviewer@example.com", "testpass123")
-        self.other_user = _create_user(
-            self.user_model, "delete_other", "delete_other@example.com", "testpass123")
-        self.business_user = _create_user(
-            self.user_model, "delete_business", "delete_business@example.com", "testpass123")
+        super().setUp()
         self.url_base = "/api/reviews/"
-        self.create_payload = {
-            "business_user": self.business_user.pk,
-            "rating": 4,
-            "description": "Alles war toll!",
-        }
-
-    def _create_review(self):
-        self.client.force_authenticate(user=self.reviewer)
-        response = self.client.post(
-            self.url_base, self.create_payload, format="json")
-        self.assertEqual(response.status_code, status.HTTP_201_CREATED)
-        return response.json().get("id")
-
-    def test_delete_review_requires_authentication(self):
-        response = self.client.delete(f"{self.url_base}1/")
-
-        self.assertEqual(response.status_code, status.HTTP_401_UNAUTHORIZED)
 
     def test_delete_review_not_found(self):
-        self.client.force_authenticate(user=self.reviewer)
-        response = self.client.delete(f"{self.url_base}999999/")
+        response = self.reviewer_client.delete(f"{self.url_base}999999/")
 
         self.assertEqual(response.status_code, status.HTTP_404_NOT_FOUND)
 
     def test_delete_review_forbidden_for_non_owner(self):
-        review_id = self._create_review()
-        self.client.force_authenticate(user=self.other_user)
-        response = self.client.delete(f"{self.url_base}{review_id}/")
+        response = self.other_client.delete(f"{self.url_base}{self.review.pk}/")
 
         self.assertEqual(response.status_code, status.HTTP_403_FORBIDDEN)
 
     def test_delete_review_success_returns_204_no_content(self):
-        review_id = self._create_review()
-        self.client.force_authenticate(user=self.reviewer)
-        response = self.client.delete(f"{self.url_base}{review_id}/")
+        response = self.reviewer_client.delete(f"{self.url_base}{self.review.pk}/")
 
         self.assertEqual(response.status_code, status.HTTP_204_NO_CONTENT)
         self.assertEqual(response.content, b"")